@@ -1,8 +1,9 @@
 """Utility functions for Confluence client."""
 
+import functools
 import logging
 from datetime import datetime
-from typing import Any, Dict, Type, TypeVar, Union, cast
+from typing import Any, Callable, Dict, Type, TypeVar, Union, cast
 
 from confluence.models import Comment, Label, Page, SearchResult, Space
 
@@ -11,6 +12,12 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T", Page, Comment, Space, SearchResult, Label)
 
 
+@functools.lru_cache(maxsize=2048)
+def _parse_iso_datetime(date_str: str) -> datetime:
+    """Parse an ISO 8601 timestamp, caching results for repeated values."""
+    return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+
+
 def parse_datetime(date_str: Union[str, None]) -> Union[datetime, None]:
     """
     Parse datetime string from Confluence API.
@@ -27,7 +34,7 @@ def parse_datetime(date_str: Union[str, None]) -> Union[datetime, None]:
     try:
         if not isinstance(date_str, str):
             raise TypeError(f"Expected string, got {type(date_str)}")
-        return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        return _parse_iso_datetime(date_str)
     except (ValueError, TypeError) as e:
         logger.warning("Failed to parse datetime: %s - %s", date_str, e)
         return None
@@ -44,18 +51,11 @@ def parse_confluence_response(response: Dict[Any, Any], model_type: Type[T]) ->
     Returns:
         Instantiated model object
     """
-    if model_type == Page:
-        return cast(T, parse_page_response(response))
-    elif model_type == Comment:
-        return cast(T, parse_comment_response(response))
-    elif model_type == Space:
-        return cast(T, parse_space_response(response))
-    elif model_type == SearchResult:
-        return cast(T, parse_search_result_response(response))
-    elif model_type == Label:
-        return cast(T, parse_label_response(response))
-    else:
-        raise ValueError(f"Unsupported model type: {model_type}")
+    try:
+        parser = _PARSERS[model_type]
+    except KeyError:
+        raise ValueError(f"Unsupported model type: {model_type}") from None
+    return cast(T, parser(response))
 
 
 def parse_page_response(response: Dict[Any, Any]) -> Page:
@@ -68,9 +68,9 @@ def parse_page_response(response: Dict[Any, Any]) -> Page:
     Returns:
         Page object
     """
-    content = None
-    if "body" in response and "storage" in response["body"]:
-        content = response["body"]["storage"].get("value")
+    body = response.get("body")
+    storage = body.get("storage") if body else None
+    content = storage.get("value") if storage is not None else None
 
     space_key = response.get("space", {}).get("key", "")
 
@@ -97,9 +97,9 @@ def parse_comment_response(response: Dict[Any, Any]) -> Comment:
     Returns:
         Comment object
     """
-    content = ""
-    if "body" in response and "storage" in response["body"]:
-        content = response["body"]["storage"].get("value", "")
+    body = response.get("body")
+    storage = body.get("storage") if body else None
+    content = storage.get("value", "") if storage is not None else ""
 
     return Comment(
         id=str(response.get("id", "")),
@@ -124,9 +124,9 @@ def parse_space_response(response: Dict[Any, Any]) -> Space:
     Returns:
         Space object
     """
-    description = None
-    if "description" in response and "plain" in response["description"]:
-        description = response["description"]["plain"].get("value", "")
+    descriptions = response.get("description")
+    plain = descriptions.get("plain") if descriptions else None
+    description = plain.get("value", "") if plain is not None else None
 
     return Space(
         id=int(response.get("id", 0)),
@@ -151,9 +151,9 @@ def parse_search_result_response(response: Dict[Any, Any]) -> SearchResult:
     Returns:
         SearchResult object
     """
-    content = None
-    if "body" in response and "view" in response["body"]:
-        content = response["body"]["view"].get("value", "")
+    body = response.get("body")
+    view = body.get("view") if body else None
+    content = view.get("value", "") if view is not None else None
 
     content_type = response.get("type", "")
     space_key = response.get("space", {}).get("key", "")
@@ -187,3 +187,13 @@ def parse_label_response(response: Dict[Any, Any]) -> Label:
         prefix=response.get("prefix", ""),
         label=response.get("label", ""),
     )
+
+
+# Response parser for each model type handled by parse_confluence_response
+_PARSERS: Dict[type, Callable[[Dict[Any, Any]], Any]] = {
+    Page: parse_page_response,
+    Comment: parse_comment_response,
+    Space: parse_space_response,
+    SearchResult: parse_search_result_response,
+    Label: parse_label_response,
+}
@@ -12,6 +12,7 @@ from fastmcp.server.auth.providers.bearer import RSAKeyPair
 from config import load_config
 from confluence import ConfluenceClient
 from tools import CommentTools, PageTools, SearchTools
+from tools._json import dumps
 
 # Configure logging
 logging.basicConfig(
@@ -70,7 +71,12 @@ auth = BearerAuthProvider(
 )
 
 # Create a named server
-mcp = FastMCP("Confluence MCP Server - Dev", lifespan=app_lifespan, auth=auth)
+mcp = FastMCP(
+    "Confluence MCP Server - Dev",
+    lifespan=app_lifespan,
+    auth=auth,
+    tool_serializer=dumps,
+)
 
 # Generate a token for testing
 token = key_pair.create_token(
@@ -93,6 +99,7 @@ def register_tools() -> None:
     mcp.add_tool(PageTools.delete_page)
     mcp.add_tool(PageTools.get_page_children)
     mcp.add_tool(PageTools.get_page_ancestors)
+    mcp.add_tool(PageTools.get_page_full)
 
     # Search tools
     mcp.add_tool(SearchTools.search_confluence)
@@ -15,6 +15,7 @@ from starlette.routing import Mount, Route
 from config import load_config
 from confluence import ConfluenceClient
 from tools import CommentTools, PageTools, SearchTools
+from tools._json import dumps
 
 # Configure logging
 logging.basicConfig(
@@ -63,7 +64,7 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
 
 
 # Create a named server
-mcp = FastMCP("Confluence MCP Server", lifespan=app_lifespan)
+mcp = FastMCP("Confluence MCP Server", lifespan=app_lifespan, tool_serializer=dumps)
 
 # Create the ASGI application
 mcp_app = mcp.http_app(path="/mcp")
@@ -102,6 +103,7 @@ def register_tools() -> None:
     mcp.add_tool(PageTools.delete_page)
     mcp.add_tool(PageTools.get_page_children)
     mcp.add_tool(PageTools.get_page_ancestors)
+    mcp.add_tool(PageTools.get_page_full)
 
     # Search tools
     mcp.add_tool(SearchTools.search_confluence)
@@ -1,13 +1,92 @@
 """Test configuration and fixtures."""
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+import hashlib
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, List, Optional, cast
+from unittest.mock import AsyncMock
 
 import pytest
+from atlassian import Confluence
 from fastmcp import Context
 
-from config import Config, ConfluenceConfig
+from config import Config, ConfluenceConfig, load_config
 from confluence.client import ConfluenceClient
 from confluence.models import Comment, Label, Page, SearchResult, Space
+from tools import _cache
+
+HTTP_FIXTURES_DIR = Path(__file__).parent / "fixtures" / "http"
+
+
+def pytest_collection_modifyitems(items: List[pytest.Item]) -> None:
+    """Run error-path tests after everything else so happy paths fail fast."""
+    items.sort(key=lambda item: item.get_closest_marker("error_path") is not None)
+
+
+class ConfluenceCacheStore:
+    """Stand-in for the Atlassian API client that replays recorded responses.
+
+    Calls are keyed by method name and keyword arguments, and each response
+    is stored as JSON under ``tests/fixtures/http/<hash>.json``. On a miss the
+    call is forwarded to ``upstream`` and recorded; without an upstream a miss
+    fails the test, so CI never reaches the network.
+    """
+
+    def __init__(
+        self, upstream: Optional[Any] = None, directory: Path = HTTP_FIXTURES_DIR
+    ):
+        self.upstream = upstream
+        self.directory = directory
+
+    @staticmethod
+    def cache_key(method: str, kwargs: Dict[str, Any]) -> str:
+        """Return the fixture file stem for a call."""
+        request = json.dumps([method, kwargs], sort_keys=True, default=str)
+        return hashlib.sha256(request.encode()).hexdigest()[:16]
+
+    def cache_fetch(self, method: str) -> Callable[..., Any]:
+        """Wrap an API method so its responses are served from disk."""
+
+        def fetch(**kwargs: Any) -> Any:
+            path = self.directory / f"{self.cache_key(method, kwargs)}.json"
+            if path.exists():
+                return json.loads(path.read_text())["response"]
+            if self.upstream is None:
+                raise LookupError(
+                    f"No recorded response for {method}({kwargs}); "
+                    "rerun with CONFLUENCE_RECORD=1 to record it"
+                )
+            response = getattr(self.upstream, method)(**kwargs)
+            self.directory.mkdir(parents=True, exist_ok=True)
+            record = {"request": {"method": method, "kwargs": kwargs}}
+            record["response"] = response
+            path.write_text(json.dumps(record, indent=2, sort_keys=True) + "\n")
+            return response
+
+        return fetch
+
+    def __getattr__(self, method: str) -> Callable[..., Any]:
+        return self.cache_fetch(method)
+
+
+@pytest.fixture(autouse=True)
+def clear_tool_caches() -> Iterator[None]:
+    """Empty the tool caches so results never leak between tests."""
+    yield
+    _cache.clear()
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run the session event loop on uvloop where it is available."""
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - uvloop does not support Windows
+        return asyncio.DefaultEventLoopPolicy()
+    return cast(asyncio.AbstractEventLoopPolicy, uvloop.EventLoopPolicy())
 
 
 @pytest.fixture
@@ -22,6 +101,21 @@ def mock_config() -> Config:
 
 
 @pytest.fixture
+def cached_confluence(mock_config: Config) -> ConfluenceClient:
+    """Return a Confluence client backed by recorded API responses.
+
+    Set CONFLUENCE_RECORD=1 along with real Confluence credentials to record
+    any responses that are missing from ``tests/fixtures/http``.
+    """
+    record = bool(os.getenv("CONFLUENCE_RECORD"))
+    config = (load_config() if record else mock_config).confluence
+    client = ConfluenceClient(config.url, config.username, config.api_token)
+    upstream = client.client if record else None
+    client.client = cast(Confluence, ConfluenceCacheStore(upstream=upstream))
+    return client
+
+
+@pytest.fixture(scope="session")
 def mock_page() -> Page:
     """Return a mock Confluence page for testing."""
     return Page(
@@ -33,7 +127,13 @@ def mock_page() -> Page:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def mock_page_dict(mock_page: Page) -> Dict[str, Any]:
+    """Return the attribute dict of the mock page for result comparisons."""
+    return dict(vars(mock_page))
+
+
+@pytest.fixture(scope="session")
 def mock_search_result() -> SearchResult:
     """Return a mock search result for testing."""
     return SearchResult(
@@ -45,7 +145,13 @@ def mock_search_result() -> SearchResult:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def mock_search_result_dict(mock_search_result: SearchResult) -> Dict[str, Any]:
+    """Return the attribute dict of the mock search result for result comparisons."""
+    return dict(vars(mock_search_result))
+
+
+@pytest.fixture(scope="session")
 def mock_space() -> Space:
     """Return a mock Confluence space for testing."""
     return Space(
@@ -57,7 +163,13 @@ def mock_space() -> Space:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def mock_space_dict(mock_space: Space) -> Dict[str, Any]:
+    """Return the attribute dict of the mock space for result comparisons."""
+    return dict(vars(mock_space))
+
+
+@pytest.fixture(scope="session")
 def mock_comment() -> Comment:
     """Return a mock Confluence comment for testing."""
     return Comment(
@@ -67,7 +179,13 @@ def mock_comment() -> Comment:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def mock_comment_dict(mock_comment: Comment) -> Dict[str, Any]:
+    """Return the attribute dict of the mock comment for result comparisons."""
+    return dict(vars(mock_comment))
+
+
+@pytest.fixture(scope="session")
 def mock_label() -> Label:
     """Return a mock Confluence label for testing."""
     return Label(
@@ -78,28 +196,84 @@ def mock_label() -> Label:
     )
 
 
+@pytest.fixture(scope="session")
+def mock_label_dict(mock_label: Label) -> Dict[str, Any]:
+    """Return the attribute dict of the mock label for result comparisons."""
+    return dict(vars(mock_label))
+
+
+def build_context(confluence: Any) -> Context:
+    """Wrap a Confluence client in the attribute chain the tools read from ctx."""
+    # Mirrors ctx.request_context.lifespan_context (server.py AppContext)
+    return cast(
+        Context,
+        SimpleNamespace(
+            request_context=SimpleNamespace(
+                lifespan_context=SimpleNamespace(confluence=confluence)
+            )
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def shared_confluence_client() -> AsyncMock:
+    """Build the spec'd mock Confluence client once per session."""
+    return AsyncMock(spec=ConfluenceClient)
+
+
+@pytest.fixture(scope="session")
+def shared_context(shared_confluence_client: AsyncMock) -> Context:
+    """Build the mock FastMCP context around the shared client once per session."""
+    return build_context(shared_confluence_client)
+
+
 @pytest.fixture
-def mock_confluence_client() -> AsyncMock:
-    """Return a mock Confluence client for testing."""
-    mock_client = AsyncMock(spec=ConfluenceClient)
-    return mock_client
+def mock_confluence_client(shared_confluence_client: AsyncMock) -> Iterator[AsyncMock]:
+    """
+    Return a mock Confluence client for testing.
+
+    The client is reset after each test, including configured return values
+    and side effects, which is cheaper than rebuilding the spec'd mock.
+    """
+    yield shared_confluence_client
+    shared_confluence_client.reset_mock(return_value=True, side_effect=True)
 
 
 @pytest.fixture
-def mock_context(
-    mock_confluence_client: ConfluenceClient,
-) -> Context:
+def mock_context(mock_confluence_client: AsyncMock, shared_context: Context) -> Context:
     """Return a mock FastMCP context for testing."""
-    # Create a mock AppContext with the mock Confluence client (matches server.py AppContext)
-    mock_app_context = MagicMock()
-    mock_app_context.confluence = mock_confluence_client
+    return shared_context
+
+
+@pytest.fixture
+def confluence(mock_confluence_client: AsyncMock) -> AsyncMock:
+    """Return the mock Confluence client attached to the mock context."""
+    return mock_confluence_client
+
+
+@pytest.fixture
+def make_context() -> Callable[..., Context]:
+    """
+    Return a factory for lightweight contexts backed by plain async stubs.
+
+    Each keyword names a Confluence client method and the value it returns; an
+    exception instance is raised instead. Use this when a test does not need
+    call assertions, as the stubs are much cheaper to build than AsyncMock.
+    """
+
+    def stub(value: Any) -> Callable[..., Any]:
+        async def method(**_: Any) -> Any:
+            if isinstance(value, BaseException):
+                # Drop any traceback left by a previous raise of a shared instance
+                raise value.with_traceback(None)
+            return value
 
-    # Create a mock RequestContext with lifespan_context pointing to AppContext
-    mock_request_context = MagicMock()
-    mock_request_context.lifespan_context = mock_app_context
+        return method
 
-    # Create a mock Context with request_context attribute
-    mock_ctx = MagicMock(spec=Context)
-    mock_ctx.request_context = mock_request_context
+    def factory(**method_returns: Any) -> Context:
+        confluence = SimpleNamespace(
+            **{name: stub(value) for name, value in method_returns.items()}
+        )
+        return build_context(confluence)
 
-    return mock_ctx
+    return factory
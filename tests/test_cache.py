@@ -0,0 +1,399 @@
+"""Tests for the tool result cache."""
+
+import asyncio
+from typing import Any, Dict
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from atlassian.errors import ApiError
+from fastmcp import Context, FastMCP
+from pytest_mock import MockerFixture
+
+from confluence.models import Page
+from tools._cache import _MISSING, TTLCache
+from tools.comment_tools import CommentTools
+from tools.page_tools import PageTools
+
+
+def http_error(status_code: int) -> httpx.HTTPStatusError:
+    """Build an HTTP error for a Confluence response with status_code."""
+    request = httpx.Request("GET", "https://test.atlassian.net/rest/api/content/1")
+    response = httpx.Response(status_code, request=request)
+    return httpx.HTTPStatusError(
+        f"{status_code} Error", request=request, response=response
+    )
+
+
+def not_found_error() -> ApiError:
+    """Build the error atlassian-python-api raises for a missing page."""
+    return ApiError("There is no content with the given id", reason=http_error(404))
+
+
+@pytest.fixture
+def clock(mocker: MockerFixture) -> Any:
+    """Freeze the cache clock at 100 seconds."""
+    return mocker.patch("tools._cache.monotonic", return_value=100.0)
+
+
+class TestTTLCache:
+    """Test the TTLCache container."""
+
+    def test_get_missing(self) -> None:
+        """Test a missing key returns the sentinel."""
+        assert TTLCache(ttl=30, maxsize=2).get("a") is _MISSING
+
+    def test_entry_expires(self, clock: Any) -> None:
+        """Test an entry is served until its TTL passes."""
+        cache = TTLCache(ttl=30, maxsize=2)
+        cache.set("a", 1)
+
+        clock.return_value = 129.0
+        assert cache.get("a") == 1
+
+        clock.return_value = 130.0
+        assert cache.get("a") is _MISSING
+        assert len(cache) == 0
+
+    def test_set_again_extends_ttl(self, clock: Any) -> None:
+        """Test the expiry of an overwritten entry does not drop the new one."""
+        cache = TTLCache(ttl=30, maxsize=2)
+        cache.set("a", 1)
+        clock.return_value = 120.0
+        cache.set("a", 2)
+
+        clock.return_value = 140.0
+        assert cache.get("a") == 2
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test the least recently read entry is evicted when full."""
+        cache = TTLCache(ttl=30, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is _MISSING
+        assert cache.get("c") == 3
+
+    def test_invalidate_related(self) -> None:
+        """Test invalidate drops entries that list the page among related IDs."""
+        cache = TTLCache(ttl=30, maxsize=4)
+        cache.set("children", [], page_id="67890", related_ids=["123", "456"])
+
+        cache.invalidate("456")
+
+        assert cache.get("children") is _MISSING
+
+    def test_invalidate(self) -> None:
+        """Test invalidate drops only the entries tagged with the page ID."""
+        cache = TTLCache(ttl=30, maxsize=4)
+        cache.set("a", 1, page_id="123")
+        cache.set("b", 2, page_id="123")
+        cache.set("c", 3, page_id="456")
+
+        cache.invalidate("123")
+
+        assert cache.get("a") is _MISSING
+        assert cache.get("b") is _MISSING
+        assert cache.get("c") == 3
+
+
+class TestTTLCacheDecorator:
+    """Test ttl_cache on the tool functions."""
+
+    async def test_repeat_call_is_cached(
+        self, mock_context: Context, confluence: AsyncMock, mock_page: Page
+    ) -> None:
+        """Test equivalent calls share one Confluence request."""
+        confluence.get_page.return_value = mock_page
+
+        first = await PageTools.get_page(mock_context, "12345")
+        second = await PageTools.get_page(mock_context, "12345", include_body=True)
+
+        assert second is first
+        assert confluence.get_page.await_count == 1
+
+    async def test_key_includes_arguments(
+        self, mock_context: Context, confluence: AsyncMock, mock_page: Page
+    ) -> None:
+        """Test calls with different arguments are cached separately."""
+        confluence.get_page.return_value = mock_page
+
+        await PageTools.get_page(mock_context, "12345", include_body=True)
+        await PageTools.get_page(mock_context, "12345", include_body=False)
+
+        assert confluence.get_page.await_count == 2
+
+    async def test_error_is_not_cached(
+        self, mock_context: Context, confluence: AsyncMock, mock_page: Page
+    ) -> None:
+        """Test a failed call is retried on the next request."""
+        confluence.get_page.side_effect = [Exception("Service unavailable"), mock_page]
+
+        first = await PageTools.get_page(mock_context, "12345")
+        second = await PageTools.get_page(mock_context, "12345")
+
+        assert first["status"] == "error"
+        assert second["status"] == "success"
+
+    async def test_not_found_is_cached_briefly(
+        self, mock_context: Context, confluence: AsyncMock, clock: Any
+    ) -> None:
+        """Test a 404 is served from the cache until the negative TTL passes."""
+        confluence.get_page.side_effect = not_found_error()
+
+        first = await PageTools.get_page(mock_context, "404")
+        clock.return_value = 104.0
+        second = await PageTools.get_page(mock_context, "404")
+        clock.return_value = 105.0
+        await PageTools.get_page(mock_context, "404")
+
+        expected = {
+            "status": "error",
+            "message": "There is no content with the given id",
+        }
+        assert first == second == expected
+        assert confluence.get_page.await_count == 2
+
+    @pytest.mark.parametrize(
+        "tool,method,error",
+        [
+            pytest.param(
+                PageTools.get_page,
+                "get_page",
+                http_error(503),
+                id="get_page-server-error",
+            ),
+            pytest.param(
+                CommentTools.get_labels,
+                "get_labels",
+                not_found_error(),
+                id="get_labels-not-found",
+            ),
+        ],
+    )
+    async def test_error_is_not_negatively_cached(
+        self,
+        mock_context: Context,
+        confluence: AsyncMock,
+        tool: Any,
+        method: str,
+        error: Exception,
+    ) -> None:
+        """Test server errors, and 404s from tools without a negative TTL, retry."""
+        getattr(confluence, method).side_effect = error
+
+        await tool(mock_context, "12345")
+        await tool(mock_context, "12345")
+
+        assert getattr(confluence, method).await_count == 2
+
+    async def test_concurrent_calls_share_request(
+        self, mock_context: Context, confluence: AsyncMock, mock_page: Page
+    ) -> None:
+        """Test concurrent identical calls wait for a single request."""
+
+        async def get_page(**_: Any) -> Page:
+            await asyncio.sleep(0)
+            return mock_page
+
+        confluence.get_page.side_effect = get_page
+
+        results = await asyncio.gather(
+            *(PageTools.get_page(mock_context, "12345") for _ in range(5))
+        )
+
+        assert confluence.get_page.await_count == 1
+        assert all(result is results[0] for result in results)
+
+    async def test_concurrent_calls_share_error(
+        self, mock_context: Context, confluence: AsyncMock
+    ) -> None:
+        """Test concurrent callers share a failed request instead of retrying it."""
+
+        async def get_page(**_: Any) -> Page:
+            await asyncio.sleep(0)
+            raise Exception("Page not found")
+
+        confluence.get_page.side_effect = get_page
+
+        results = await asyncio.gather(
+            *(PageTools.get_page(mock_context, "12345") for _ in range(5))
+        )
+
+        assert confluence.get_page.await_count == 1
+        assert results == [{"status": "error", "message": "Page not found"}] * 5
+
+    async def test_cancelled_caller_does_not_cancel_fetch(
+        self, mock_context: Context, confluence: AsyncMock, mock_page: Page
+    ) -> None:
+        """Test the shared request survives one of its callers being cancelled."""
+        release = asyncio.Event()
+
+        async def get_page(**_: Any) -> Page:
+            await release.wait()
+            return mock_page
+
+        confluence.get_page.side_effect = get_page
+
+        first = asyncio.ensure_future(PageTools.get_page(mock_context, "12345"))
+        second = asyncio.ensure_future(PageTools.get_page(mock_context, "12345"))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert (await second)["status"] == "success"
+        assert first.cancelled()
+        assert confluence.get_page.await_count == 1
+
+    @pytest.mark.parametrize(
+        "write,kwargs",
+        [
+            pytest.param(
+                PageTools.update_page,
+                {"page_id": "12345", "title": "Title", "content": "Body"},
+                id="update_page",
+            ),
+            pytest.param(PageTools.delete_page, {"page_id": "12345"}, id="delete_page"),
+            pytest.param(
+                CommentTools.add_comment,
+                {"page_id": "12345", "content": "Comment"},
+                id="add_comment",
+            ),
+            pytest.param(
+                CommentTools.add_label,
+                {"page_id": "12345", "label": "label"},
+                id="add_label",
+            ),
+        ],
+    )
+    async def test_write_invalidates_page(
+        self,
+        mock_context: Context,
+        confluence: AsyncMock,
+        mock_page: Page,
+        write: Any,
+        kwargs: Dict[str, Any],
+    ) -> None:
+        """Test writing to a page purges its cached reads."""
+        confluence.get_page.return_value = mock_page
+        confluence.update_page.return_value = mock_page
+        confluence.delete_page.return_value = {"page_id": "12345"}
+        confluence.add_label.return_value = {
+            "status": "success",
+            "label": "label",
+            "page_id": "12345",
+        }
+
+        await PageTools.get_page(mock_context, "12345")
+        written = await write(mock_context, **kwargs)
+        await PageTools.get_page(mock_context, "12345")
+
+        assert written["status"] == "success"
+        assert confluence.get_page.await_count == 2
+
+    async def test_create_page_invalidates_parent(
+        self, mock_context: Context, confluence: AsyncMock, mock_page: Page
+    ) -> None:
+        """Test creating a child page purges the parent's cached children."""
+        confluence.get_page_children.return_value = []
+        confluence.create_page.return_value = mock_page
+
+        await PageTools.get_page_children(mock_context, "67890")
+        await PageTools.create_page(
+            mock_context, "Child", "<p>Child</p>", "TEST", parent_id=67890
+        )
+        await PageTools.get_page_children(mock_context, "67890")
+
+        assert confluence.get_page_children.await_count == 2
+
+    async def test_write_during_read_is_not_cached(
+        self, mock_context: Context, confluence: AsyncMock, mock_page: Page
+    ) -> None:
+        """Test a read that started before a write does not cache the old page."""
+        fetched = asyncio.Event()
+        release = asyncio.Event()
+
+        async def get_page(**_: Any) -> Page:
+            fetched.set()
+            await release.wait()
+            return mock_page
+
+        confluence.get_page.side_effect = get_page
+        confluence.update_page.return_value = mock_page
+
+        read = asyncio.ensure_future(PageTools.get_page(mock_context, "12345"))
+        await fetched.wait()
+        await PageTools.update_page(mock_context, "12345", "Title", "Body")
+        release.set()
+        await read
+
+        confluence.get_page.side_effect = None
+        confluence.get_page.return_value = mock_page
+        await PageTools.get_page(mock_context, "12345")
+
+        assert confluence.get_page.await_count == 2
+
+    async def test_write_during_read_starts_new_read(
+        self, mock_context: Context, confluence: AsyncMock, mock_page: Page
+    ) -> None:
+        """Test a read after a write does not join a read that started before it."""
+        release = asyncio.Event()
+
+        async def get_page(**_: Any) -> Page:
+            await release.wait()
+            return mock_page
+
+        confluence.get_page.side_effect = get_page
+        confluence.update_page.return_value = mock_page
+
+        first = asyncio.ensure_future(PageTools.get_page(mock_context, "12345"))
+        await asyncio.sleep(0)
+        await PageTools.update_page(mock_context, "12345", "Title", "Body")
+        second = asyncio.ensure_future(PageTools.get_page(mock_context, "12345"))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(first, second)
+
+        assert confluence.get_page.await_count == 2
+
+    @pytest.mark.parametrize(
+        "write,kwargs",
+        [
+            pytest.param(
+                PageTools.update_page,
+                {"page_id": "12345", "title": "Title", "content": "Body"},
+                id="update_page",
+            ),
+            pytest.param(PageTools.delete_page, {"page_id": "12345"}, id="delete_page"),
+        ],
+    )
+    async def test_write_to_child_invalidates_parent(
+        self,
+        mock_context: Context,
+        confluence: AsyncMock,
+        mock_page: Page,
+        write: Any,
+        kwargs: Dict[str, Any],
+    ) -> None:
+        """Test writing to a child page purges its parent's cached children."""
+        confluence.get_page_children.return_value = [mock_page]
+        confluence.update_page.return_value = mock_page
+        confluence.delete_page.return_value = {"page_id": "12345"}
+
+        await PageTools.get_page_children(mock_context, "67890")
+        await write(mock_context, **kwargs)
+        await PageTools.get_page_children(mock_context, "67890")
+
+        assert confluence.get_page_children.await_count == 2
+
+    async def test_tool_schema_unchanged(self) -> None:
+        """Test FastMCP still builds the tool schema from the wrapped signature."""
+        mcp = FastMCP("test")
+        mcp.add_tool(PageTools.get_page)
+
+        tool = (await mcp.get_tools())["get_page"]
+
+        assert set(tool.parameters["properties"]) == {"page_id", "include_body"}
@@ -9,7 +9,6 @@ from confluence.client import ConfluenceClient
 from confluence.models import Comment, Label, Page, SearchResult, Space
 
 
-@pytest.mark.asyncio
 async def test_client_initialization() -> None:
     """Test Confluence client initialization."""
     url = "https://test.atlassian.net"
@@ -31,7 +30,6 @@ async def test_client_initialization() -> None:
         )
 
 
-@pytest.mark.asyncio
 async def test_disconnect() -> None:
     """Test client disconnect method."""
     with patch("confluence.client.Confluence"):
@@ -44,7 +42,6 @@ async def test_disconnect() -> None:
             mock_logger.info.assert_called_once_with("Disconnecting from Confluence")
 
 
-@pytest.mark.asyncio
 async def test_get_page_success() -> None:
     """Test successful page retrieval."""
     page_id = "12345"
@@ -74,7 +71,6 @@ async def test_get_page_success() -> None:
         )
 
 
-@pytest.mark.asyncio
 async def test_get_page_no_body() -> None:
     """Test page retrieval without body content."""
     page_id = "12345"
@@ -102,7 +98,25 @@ async def test_get_page_no_body() -> None:
         )
 
 
-@pytest.mark.asyncio
+async def test_get_page_recorded(cached_confluence: ConfluenceClient) -> None:
+    """Test page retrieval against a recorded Confluence response."""
+    result = await cached_confluence.get_page("12345", include_body=True)
+
+    assert isinstance(result, Page)
+    assert result.id == "12345"
+    assert result.title == "Test Page"
+    assert result.space_key == "TEST"
+    assert result.version == 3
+    assert result.content == "<p>Test content</p>"
+    assert result.url == "/spaces/TEST/pages/12345/Test+Page"
+
+
+async def test_get_page_not_recorded(cached_confluence: ConfluenceClient) -> None:
+    """Test that a missing recording fails instead of reaching the network."""
+    with pytest.raises(LookupError, match="No recorded response for get_page_by_id"):
+        await cached_confluence.get_page("99999", include_body=True)
+
+
 async def test_get_page_not_found() -> None:
     """Test page retrieval when page not found."""
     page_id = "nonexistent"
@@ -120,7 +134,6 @@ async def test_get_page_not_found() -> None:
             await client.get_page(page_id)
 
 
-@pytest.mark.asyncio
 async def test_create_page_success() -> None:
     """Test successful page creation."""
     space_key = "TEST"
@@ -158,7 +171,6 @@ async def test_create_page_success() -> None:
         )
 
 
-@pytest.mark.asyncio
 async def test_create_page_with_parent() -> None:
     """Test page creation with parent."""
     space_key = "TEST"
@@ -198,7 +210,6 @@ async def test_create_page_with_parent() -> None:
         )
 
 
-@pytest.mark.asyncio
 async def test_update_page_success() -> None:
     """Test successful page update."""
     page_id = "12345"
@@ -237,7 +248,6 @@ async def test_update_page_success() -> None:
         )
 
 
-@pytest.mark.asyncio
 async def test_delete_page_success() -> None:
     """Test successful page deletion."""
     page_id = "12345"
@@ -257,7 +267,6 @@ async def test_delete_page_success() -> None:
         mock_client.remove_page.assert_called_once_with(page_id=page_id)
 
 
-@pytest.mark.asyncio
 async def test_get_page_children() -> None:
     """Test getting page children."""
     page_id = "12345"
@@ -295,7 +304,6 @@ async def test_get_page_children() -> None:
         )
 
 
-@pytest.mark.asyncio
 async def test_get_page_ancestors() -> None:
     """Test getting page ancestors."""
     page_id = "12345"
@@ -337,7 +345,6 @@ async def test_get_page_ancestors() -> None:
         )
 
 
-@pytest.mark.asyncio
 async def test_search_content() -> None:
     """Test content search."""
     query = "test search"
@@ -391,7 +398,6 @@ async def test_search_content() -> None:
         )
 
 
-@pytest.mark.asyncio
 async def test_get_spaces() -> None:
     """Test getting spaces."""
     mock_response = {
@@ -420,7 +426,6 @@ async def test_get_spaces() -> None:
         )
 
 
-@pytest.mark.asyncio
 async def test_get_comments() -> None:
     """Test getting page comments."""
     page_id = "12345"
@@ -460,7 +465,6 @@ async def test_get_comments() -> None:
         )
 
 
-@pytest.mark.asyncio
 async def test_add_comment() -> None:
     """Test adding a comment to a page."""
     page_id = "12345"
@@ -487,7 +491,6 @@ async def test_add_comment() -> None:
         mock_client.add_comment.assert_called_once_with(page_id=page_id, text=content)
 
 
-@pytest.mark.asyncio
 async def test_get_labels() -> None:
     """Test getting page labels."""
     page_id = "12345"
@@ -515,7 +518,6 @@ async def test_get_labels() -> None:
         mock_client.get_page_labels.assert_called_once_with(page_id=page_id)
 
 
-@pytest.mark.asyncio
 async def test_add_label() -> None:
     """Test adding a label to a page."""
     page_id = "12345"
@@ -537,7 +539,6 @@ async def test_add_label() -> None:
         mock_client.set_page_label.assert_called_once_with(page_id=page_id, label=label)
 
 
-@pytest.mark.asyncio
 async def test_error_handling() -> None:
     """Test error handling in client methods."""
     page_id = "12345"
@@ -555,7 +556,6 @@ async def test_error_handling() -> None:
             await client.get_page(page_id)
 
 
-@pytest.mark.asyncio
 async def test_client_properties() -> None:
     """Test client property access."""
     url = "https://test.atlassian.net"
@@ -570,7 +570,6 @@ async def test_client_properties() -> None:
         assert client.api_token == api_token
 
 
-@pytest.mark.asyncio
 async def test_search_with_spaces_and_content_type() -> None:
     """Test search with space and content type filters."""
     query = "test search"
@@ -613,7 +612,6 @@ async def test_search_with_spaces_and_content_type() -> None:
         )
 
 
-@pytest.mark.asyncio
 async def test_parameter_mapping_bug() -> None:
     """Test that demonstrates what we're actually testing - parameter mapping bugs."""
     space_key = "TEST"
@@ -654,7 +652,6 @@ async def test_parameter_mapping_bug() -> None:
         )
 
 
-@pytest.mark.asyncio
 async def test_response_processing_logic() -> None:
     """Test that we correctly process the API response."""
     space_key = "TEST"
@@ -693,7 +690,6 @@ async def test_response_processing_logic() -> None:
         # Note: Based on the error, Page.space might be a dict, not an object
 
 
-@pytest.mark.asyncio
 async def test_error_scenarios() -> None:
     """Test various error conditions."""
     with patch("confluence.client.Confluence") as mock_confluence_class:
@@ -716,7 +712,6 @@ async def test_error_scenarios() -> None:
             await client.create_page("TEST", "Title", "Content")
 
 
-@pytest.mark.asyncio
 async def test_null_response_scenarios() -> None:
     """Test handling of null responses from Confluence API."""
     with patch("confluence.client.Confluence") as mock_confluence_class:
@@ -756,7 +751,6 @@ async def test_null_response_scenarios() -> None:
             await client.get_spaces()
 
 
-@pytest.mark.asyncio
 async def test_search_cql_error_handling() -> None:
     """Test error handling in search method with CQL failures."""
     with patch("confluence.client.Confluence") as mock_confluence_class:
@@ -774,7 +768,6 @@ async def test_search_cql_error_handling() -> None:
             await client.search("test query")
 
 
-@pytest.mark.asyncio
 async def test_add_label_exception_handling() -> None:
     """Test exception handling in add_label method."""
     page_id = "12345"
@@ -28,7 +28,6 @@ class TestAppLifespan:
         """Mock FastMCP server for testing."""
         return MagicMock()
 
-    @pytest.mark.asyncio
     async def test_app_lifespan_success(
         self, mock_fastmcp_server: MagicMock, mock_config: MagicMock
     ) -> None:
@@ -53,7 +52,6 @@ class TestAppLifespan:
                     api_token=mock_config.confluence.api_token,
                 )
 
-    @pytest.mark.asyncio
     async def test_app_lifespan_config_error(
         self, mock_fastmcp_server: MagicMock
     ) -> None:
@@ -63,7 +61,6 @@ class TestAppLifespan:
                 async with app_lifespan(mock_fastmcp_server):
                     pass
 
-    @pytest.mark.asyncio
     async def test_app_lifespan_client_error(
         self, mock_fastmcp_server: MagicMock, mock_config: MagicMock
     ) -> None:
@@ -78,7 +75,6 @@ class TestAppLifespan:
                 async with app_lifespan(mock_fastmcp_server):
                     pass
 
-    @pytest.mark.asyncio
     @patch("server.logger")
     async def test_app_lifespan_logging(
         self,
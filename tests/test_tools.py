@@ -1,51 +1,102 @@
 """Tests for MCP tools."""
 
-from typing import Any
+import asyncio
+import json
+import logging
+from dataclasses import replace
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from unittest.mock import AsyncMock, call
 
 import pytest
 from fastmcp import Context
 
+from confluence.models import Comment, Label, Page, SearchResult, Space
+from tools._json import dumps
+from tools._util import dataclass_formatter
 from tools.comment_tools import CommentTools
-from tools.page_tools import PageTools
+from tools.page_tools import PageTools, _expand
 from tools.search_tools import SearchTools
 
+# Shared client errors for the error-path tests
+NOT_FOUND_ERROR = Exception("Page not found")
+PERMISSION_ERROR = Exception("Permission denied")
+SEARCH_ERROR = Exception("Search service unavailable")
 
-@pytest.mark.asyncio
-async def test_get_page_tool(mock_context: Context, mock_page: Any) -> None:
-    """Test get_page tool."""
+
+# PageTools tests
+
+
+@pytest.mark.happy_path
+@pytest.mark.parametrize("include_body", [True, False])
+async def test_get_page_tool(
+    mock_context: Context,
+    confluence: AsyncMock,
+    mock_page: Page,
+    mock_page_dict: Dict[str, Any],
+    include_body: bool,
+) -> None:
+    """Test get_page tool with and without the page body."""
     page_id = "12345"
-    include_body = True
 
     # Setup mock response
-    mock_context.request_context.lifespan_context.confluence.get_page.return_value = (
-        mock_page
-    )
+    confluence.get_page.return_value = mock_page
 
     # Call the tool
     result = await PageTools.get_page(mock_context, page_id, include_body)
 
     # Check that the method was called with the correct arguments
-    mock_context.request_context.lifespan_context.confluence.get_page.assert_called_once_with(
-        page_id=page_id,
-        include_body=include_body,
-    )
+    assert confluence.get_page.call_args_list == [
+        call(
+            page_id=page_id,
+            include_body=include_body,
+        )
+    ]
 
     # Check the result structure
     assert result["status"] == "success"
-    assert result["page"] == mock_page.__dict__
+    assert result["page"] == mock_page_dict
 
 
-@pytest.mark.asyncio
-async def test_create_page_tool(mock_context: Context, mock_page: Any) -> None:
-    """Test create_page tool."""
+@pytest.mark.happy_path
+async def test_get_page_tool_logs_page_id(
+    mock_context: Context,
+    confluence: AsyncMock,
+    mock_page: Page,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test get_page logs the fetched page ID without its content."""
+    confluence.get_page.return_value = mock_page
+
+    with caplog.at_level(logging.DEBUG, logger="tools.page_tools"):
+        await PageTools.get_page(mock_context, "12345")
+
+    assert caplog.messages == ["page 12345 fetched"]
+
+
+@pytest.mark.happy_path
+@pytest.mark.parametrize(
+    "title,content,parent_id,content_format",
+    [
+        pytest.param("Test Page", "<p>Test content</p>", None, "storage", id="root"),
+        pytest.param("Child Page", "<p>Child content</p>", 67890, "wiki", id="child"),
+    ],
+)
+async def test_create_page_tool(
+    mock_context: Context,
+    confluence: AsyncMock,
+    mock_page: Page,
+    mock_page_dict: Dict[str, Any],
+    title: str,
+    content: str,
+    parent_id: Optional[int],
+    content_format: str,
+) -> None:
+    """Test create_page tool with and without a parent page."""
     space_key = "TEST"
-    title = "Test Page"
-    content = "<p>Test content</p>"
-    parent_id = None
-    content_format = "storage"
 
     # Setup mock response
-    mock_context.request_context.lifespan_context.confluence.create_page.return_value = mock_page
+    confluence.create_page.return_value = mock_page
 
     # Call the tool
     result = await PageTools.create_page(
@@ -58,911 +109,701 @@ async def test_create_page_tool(mock_context: Context, mock_page: Any) -> None:
     )
 
     # Check that the method was called with the correct arguments
-    mock_context.request_context.lifespan_context.confluence.create_page.assert_called_once_with(
-        space_key=space_key,
-        title=title,
-        content=content,
-        parent_id=parent_id,
-        content_format=content_format,
-    )
+    assert confluence.create_page.call_args_list == [
+        call(
+            space_key=space_key,
+            title=title,
+            content=content,
+            parent_id=parent_id,
+            content_format=content_format,
+        )
+    ]
 
     # Check the result structure
     assert result["status"] == "success"
-    assert result["page"] == mock_page.__dict__
-
-
-@pytest.mark.asyncio
-async def test_search_confluence_tool(
-    mock_context: Context, mock_search_result: Any
+    assert result["page"] == mock_page_dict
+
+
+@pytest.mark.happy_path
+@pytest.mark.parametrize(
+    "options,expected_options",
+    [
+        pytest.param(
+            (True, "storage", "Updated for testing"),
+            {
+                "minor_edit": True,
+                "content_format": "storage",
+                "version_comment": "Updated for testing",
+            },
+            id="explicit",
+        ),
+        pytest.param(
+            (),
+            {"minor_edit": False, "content_format": "storage", "version_comment": None},
+            id="defaults",
+        ),
+    ],
+)
+async def test_update_page_tool(
+    mock_context: Context,
+    confluence: AsyncMock,
+    mock_page: Page,
+    mock_page_dict: Dict[str, Any],
+    options: Tuple[Any, ...],
+    expected_options: Dict[str, Any],
 ) -> None:
-    """Test search_confluence tool."""
-    query = "test"
-    spaces = ["TEST"]
-    content_type = "page"
-    limit = 10
+    """Test update_page tool with explicit and default options."""
+    page_id = "12345"
+    title = "Updated Page"
+    content = "<p>Updated content</p>"
 
     # Setup mock response
-    mock_context.request_context.lifespan_context.confluence.search.return_value = [
-        mock_search_result
-    ]
+    confluence.update_page.return_value = mock_page
 
     # Call the tool
-    result = await SearchTools.search_confluence(
-        mock_context,
-        query,
-        spaces,
-        content_type,
-        limit,
+    result = await PageTools.update_page(
+        mock_context, page_id, title, content, *options
     )
 
     # Check that the method was called with the correct arguments
-    mock_context.request_context.lifespan_context.confluence.search.assert_called_once_with(
-        query=query,
-        spaces=spaces,
-        content_type=content_type,
-        limit=limit,
-    )
-
-    # Check the result structure
-    assert result["status"] == "success"
-    assert len(result["results"]) == 1
-    assert result["results"][0] == mock_search_result.__dict__
-    assert result["count"] == 1
-
-
-@pytest.mark.asyncio
-async def test_get_comments_tool(mock_context: Context, mock_comment: Any) -> None:
-    """Test get_comments tool."""
-    page_id = "12345"
-    depth = "all"
-
-    # Setup mock response
-    mock_context.request_context.lifespan_context.confluence.get_comments.return_value = [
-        mock_comment
+    assert confluence.update_page.call_args_list == [
+        call(
+            page_id=page_id,
+            title=title,
+            content=content,
+            **expected_options,
+        )
     ]
 
-    # Call the tool
-    result = await CommentTools.get_comments(mock_context, page_id, depth)
-
-    # Check that the method was called with the correct arguments
-    mock_context.request_context.lifespan_context.confluence.get_comments.assert_called_once_with(
-        page_id=page_id,
-        depth=depth,
-    )
-
     # Check the result structure
     assert result["status"] == "success"
-    assert len(result["comments"]) == 1
-    assert result["comments"][0] == mock_comment.__dict__
-    assert result["count"] == 1
+    assert result["page"] == mock_page_dict
 
 
-@pytest.mark.asyncio
-async def test_add_label_tool(mock_context: Context) -> None:
-    """Test add_label tool."""
+@pytest.mark.happy_path
+async def test_delete_page_tool(mock_context: Context, confluence: AsyncMock) -> None:
+    """Test delete_page tool."""
     page_id = "12345"
-    label = "test-label"
-    expected_result = {"status": "success", "label": label, "page_id": page_id}
 
     # Setup mock response
-    mock_context.request_context.lifespan_context.confluence.add_label.return_value = (
-        expected_result
-    )
+    confluence.delete_page.return_value = {"page_id": page_id}
 
     # Call the tool
-    result = await CommentTools.add_label(mock_context, page_id, label)
+    result = await PageTools.delete_page(mock_context, page_id)
 
     # Check that the method was called with the correct arguments
-    mock_context.request_context.lifespan_context.confluence.add_label.assert_called_once_with(
-        page_id=page_id,
-        label=label,
-    )
-
-    # Check the result structure
-    assert result == expected_result
-
-
-@pytest.mark.asyncio
-async def test_get_spaces_tool(mock_context: Context, mock_space: Any) -> None:
-    """Test get_spaces tool."""
-    limit = 25
-
-    # Setup mock response
-    mock_context.request_context.lifespan_context.confluence.get_spaces.return_value = [
-        mock_space
+    assert confluence.delete_page.call_args_list == [
+        call(
+            page_id=page_id,
+        )
     ]
 
-    # Call the tool
-    result = await SearchTools.get_spaces(mock_context, limit)
-
-    # Check that the method was called with the correct arguments
-    mock_context.request_context.lifespan_context.confluence.get_spaces.assert_called_once_with(
-        limit=limit,
-    )
-
     # Check the result structure
     assert result["status"] == "success"
-    assert len(result["spaces"]) == 1
-    assert result["spaces"][0] == mock_space.__dict__
-    assert result["count"] == 1
+    assert result["page_id"] == page_id
 
 
-# Test add_comment tool - success case
-@pytest.mark.asyncio
-async def test_add_comment_tool(mock_context: Context, mock_comment: Any) -> None:
-    """Test add_comment tool."""
+@pytest.mark.happy_path
+@pytest.mark.parametrize(
+    "args", [pytest.param((25,), id="explicit"), pytest.param((), id="defaults")]
+)
+async def test_get_page_children_tool(
+    mock_context: Context,
+    confluence: AsyncMock,
+    mock_page: Page,
+    mock_page_dict: Dict[str, Any],
+    args: Tuple[Any, ...],
+) -> None:
+    """Test get_page_children tool with an explicit and the default limit."""
     page_id = "12345"
-    content = "This is a test comment"
 
     # Setup mock response
-    mock_context.request_context.lifespan_context.confluence.add_comment.return_value = mock_comment
+    confluence.get_page_children.return_value = [mock_page]
 
     # Call the tool
-    result = await CommentTools.add_comment(mock_context, page_id, content)
+    result = await PageTools.get_page_children(mock_context, page_id, *args)
 
     # Check that the method was called with the correct arguments
-    mock_context.request_context.lifespan_context.confluence.add_comment.assert_called_once_with(
-        page_id=page_id,
-        content=content,
-    )
-
-    # Check the result structure
-    assert result["status"] == "success"
-    assert result["comment"] == mock_comment.__dict__
-
-
-@pytest.mark.asyncio
-async def test_get_labels_tool(mock_context: Context, mock_label: Any) -> None:
-    """Test get_labels tool."""
-    page_id = "12345"
-
-    # Setup mock response
-    mock_context.request_context.lifespan_context.confluence.get_labels.return_value = [
-        mock_label
+    assert confluence.get_page_children.call_args_list == [
+        call(
+            page_id=page_id,
+            limit=25,
+        )
     ]
 
-    # Call the tool
-    result = await CommentTools.get_labels(mock_context, page_id)
-
-    # Check that the method was called with the correct arguments
-    mock_context.request_context.lifespan_context.confluence.get_labels.assert_called_once_with(
-        page_id=page_id,
-    )
-
     # Check the result structure
     assert result["status"] == "success"
-    assert len(result["labels"]) == 1
-    assert result["labels"][0] == mock_label.__dict__
+    assert result["children"] == [mock_page_dict]
     assert result["count"] == 1
 
 
-# Error handling tests
-@pytest.mark.asyncio
-async def test_get_comments_tool_error(mock_context: Context) -> None:
-    """Test get_comments tool with error."""
-    page_id = "12345"
-    error_message = "Page not found"
-
-    # Setup mock to raise an exception
-    mock_context.request_context.lifespan_context.confluence.get_comments.side_effect = Exception(
-        error_message
-    )
-
-    # Call the tool
-    result = await CommentTools.get_comments(mock_context, page_id)
-
-    # Check the result structure
-    assert result["status"] == "error"
-    assert result["message"] == error_message
-
-
-@pytest.mark.asyncio
-async def test_add_comment_tool_error(mock_context: Context) -> None:
-    """Test add_comment tool with error."""
-    page_id = "12345"
-    content = "This is a test comment"
-    error_message = "Permission denied"
-
-    # Setup mock to raise an exception
-    mock_context.request_context.lifespan_context.confluence.add_comment.side_effect = (
-        Exception(error_message)
-    )
-
-    # Call the tool
-    result = await CommentTools.add_comment(mock_context, page_id, content)
-
-    # Check the result structure
-    assert result["status"] == "error"
-    assert result["message"] == error_message
-
-
-@pytest.mark.asyncio
-async def test_get_labels_tool_error(mock_context: Context) -> None:
-    """Test get_labels tool with error."""
-    page_id = "12345"
-    error_message = "Page not found"
-
-    # Setup mock to raise an exception
-    mock_context.request_context.lifespan_context.confluence.get_labels.side_effect = (
-        Exception(error_message)
-    )
-
-    # Call the tool
-    result = await CommentTools.get_labels(mock_context, page_id)
-
-    # Check the result structure
-    assert result["status"] == "error"
-    assert result["message"] == error_message
-
-
-@pytest.mark.asyncio
-async def test_add_label_tool_error(mock_context: Context) -> None:
-    """Test add_label tool with error."""
-    page_id = "12345"
-    label = "test-label"
-    error_message = "Permission denied"
-
-    # Setup mock to raise an exception
-    mock_context.request_context.lifespan_context.confluence.add_label.side_effect = (
-        Exception(error_message)
-    )
-
-    # Call the tool
-    result = await CommentTools.add_label(mock_context, page_id, label)
-
-    # Check the result structure
-    assert result["status"] == "error"
-    assert result["message"] == error_message
-
-
-@pytest.mark.asyncio
-async def test_add_label_tool_non_dict_result(mock_context: Context) -> None:
-    """Test add_label tool when client returns non-dict result."""
-    page_id = "12345"
-    label = "test-label"
-    non_dict_result = "success"
-
-    # Setup mock response to return a non-dict value
-    mock_context.request_context.lifespan_context.confluence.add_label.return_value = (
-        non_dict_result
-    )
-
-    # Call the tool
-    result = await CommentTools.add_label(mock_context, page_id, label)
-
-    # Check the result structure
-    assert result["status"] == "success"
-    assert result["result"] == non_dict_result
-
-
-@pytest.mark.asyncio
-async def test_get_comments_tool_with_depth_parameter(
-    mock_context: Context, mock_comment: Any
+@pytest.mark.happy_path
+async def test_get_page_ancestors_tool(
+    mock_context: Context,
+    confluence: AsyncMock,
+    mock_page: Page,
+    mock_page_dict: Dict[str, Any],
 ) -> None:
-    """Test get_comments tool with specific depth parameter."""
+    """Test get_page_ancestors tool."""
     page_id = "12345"
-    depth = "root"
 
     # Setup mock response
-    mock_context.request_context.lifespan_context.confluence.get_comments.return_value = [
-        mock_comment
-    ]
+    confluence.get_page_ancestors.return_value = [mock_page]
 
     # Call the tool
-    result = await CommentTools.get_comments(mock_context, page_id, depth)
+    result = await PageTools.get_page_ancestors(mock_context, page_id)
 
     # Check that the method was called with the correct arguments
-    mock_context.request_context.lifespan_context.confluence.get_comments.assert_called_once_with(
-        page_id=page_id,
-        depth=depth,
-    )
+    assert confluence.get_page_ancestors.call_args_list == [
+        call(
+            page_id=page_id,
+        )
+    ]
 
     # Check the result structure
     assert result["status"] == "success"
-    assert len(result["comments"]) == 1
-    assert result["comments"][0] == mock_comment.__dict__
+    assert result["ancestors"] == [mock_page_dict]
     assert result["count"] == 1
 
 
-@pytest.mark.asyncio
-async def test_get_comments_tool_empty_result(mock_context: Context) -> None:
-    """Test get_comments tool with no comments."""
-    page_id = "12345"
-
-    # Setup mock response with empty list
-    mock_context.request_context.lifespan_context.confluence.get_comments.return_value = []
-
-    # Call the tool
-    result = await CommentTools.get_comments(mock_context, page_id)
-
-    # Check the result structure
-    assert result["status"] == "success"
-    assert result["comments"] == []
-    assert result["count"] == 0
-
-
-@pytest.mark.asyncio
-async def test_get_labels_tool_empty_result(mock_context: Context) -> None:
-    """Test get_labels tool with no labels."""
-    page_id = "12345"
-
-    # Setup mock response with empty list
-    mock_context.request_context.lifespan_context.confluence.get_labels.return_value = []
+@pytest.mark.happy_path
+@pytest.mark.parametrize(
+    "tool,client_method,result_key",
+    [
+        pytest.param(
+            PageTools.get_page_children,
+            "get_page_children",
+            "children",
+            id="get_page_children",
+        ),
+        pytest.param(
+            PageTools.get_page_ancestors,
+            "get_page_ancestors",
+            "ancestors",
+            id="get_page_ancestors",
+        ),
+    ],
+)
+async def test_related_pages_include_body(
+    mock_context: Context,
+    confluence: AsyncMock,
+    mock_page: Page,
+    mock_page_dict: Dict[str, Any],
+    tool: Callable[..., Awaitable[Dict[str, Any]]],
+    client_method: str,
+    result_key: str,
+) -> None:
+    """Test related pages are re-fetched with their body when requested."""
+    listed = [
+        Page(id=str(i), title=f"Page {i}", space_key="TEST", version=1)
+        for i in range(3)
+    ]
+    getattr(confluence, client_method).return_value = listed
+    confluence.get_page.return_value = mock_page
 
-    # Call the tool
-    result = await CommentTools.get_labels(mock_context, page_id)
+    result = await tool(mock_context, "12345", include_body=True)
 
-    # Check the result structure
+    assert confluence.get_page.call_args_list == [
+        call(page_id=page.id, include_body=True) for page in listed
+    ]
     assert result["status"] == "success"
-    assert result["labels"] == []
-    assert result["count"] == 0
-
-
-# Additional PageTools tests for 100% coverage
-
-
-@pytest.mark.asyncio
-async def test_get_page_tool_error(mock_context: Context) -> None:
-    """Test get_page tool with error."""
+    assert result[result_key] == [mock_page_dict] * 3
+    assert result["count"] == 3
+
+
+@pytest.mark.happy_path
+async def test_expand_bounds_concurrency() -> None:
+    """Test _expand keeps results in order with at most five calls in flight."""
+    in_flight = peak = 0
+
+    async def fetch(item: int) -> int:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return item * 2
+
+    assert await _expand(range(12), fetch) == [item * 2 for item in range(12)]
+    assert peak == 5
+
+
+@pytest.mark.happy_path
+async def test_get_page_full_tool(
+    mock_context: Context,
+    confluence: AsyncMock,
+    mock_page: Page,
+    mock_page_dict: Dict[str, Any],
+    mock_comment: Comment,
+    mock_comment_dict: Dict[str, Any],
+    mock_label: Label,
+    mock_label_dict: Dict[str, Any],
+) -> None:
+    """Test get_page_full fetches the page, comments and labels concurrently."""
     page_id = "12345"
-    error_message = "Page not found"
+    started = []
 
-    # Setup mock to raise an exception
-    mock_context.request_context.lifespan_context.confluence.get_page.side_effect = (
-        Exception(error_message)
-    )
-
-    # Call the tool
-    result = await PageTools.get_page(mock_context, page_id)
+    def track(name: str, value: Any) -> Callable[..., Awaitable[Any]]:
+        async def method(**_: Any) -> Any:
+            started.append(name)
+            await asyncio.sleep(0)
+            # Every request is in flight before the first one completes
+            assert len(started) == 3
+            return value
 
-    # Check the result structure
-    assert result["status"] == "error"
-    assert result["message"] == error_message
+        return method
 
+    confluence.get_page.side_effect = track("page", mock_page)
+    confluence.get_comments.side_effect = track("comments", [mock_comment])
+    confluence.get_labels.side_effect = track("labels", [mock_label])
 
-@pytest.mark.asyncio
-async def test_create_page_tool_error(mock_context: Context) -> None:
-    """Test create_page tool with error."""
-    space_key = "TEST"
-    title = "Test Page"
-    content = "<p>Test content</p>"
-    error_message = "Permission denied"
+    result = await PageTools.get_page_full(mock_context, page_id)
 
-    # Setup mock to raise an exception
-    mock_context.request_context.lifespan_context.confluence.create_page.side_effect = (
-        Exception(error_message)
-    )
+    assert confluence.get_page.call_args_list == [
+        call(page_id=page_id, include_body=True)
+    ]
+    assert confluence.get_comments.call_args_list == [call(page_id=page_id)]
+    assert confluence.get_labels.call_args_list == [call(page_id=page_id)]
+    assert result == {
+        "status": "success",
+        "page": mock_page_dict,
+        "comments": [mock_comment_dict],
+        "labels": [mock_label_dict],
+    }
+
+
+@pytest.mark.happy_path
+async def test_get_page_full_tool_page_only(
+    make_context: Callable[..., Context],
+    mock_page: Page,
+    mock_page_dict: Dict[str, Any],
+) -> None:
+    """Test get_page_full skips comments and labels when they are not wanted."""
+    ctx = make_context(get_page=mock_page)
 
-    # Call the tool
-    result = await PageTools.create_page(
-        mock_context,
-        title,
-        content,
-        space_key,
+    result = await PageTools.get_page_full(
+        ctx, "12345", include_comments=False, include_labels=False
     )
 
-    # Check the result structure
-    assert result["status"] == "error"
-    assert result["message"] == error_message
-
+    assert result == {"status": "success", "page": mock_page_dict}
 
-@pytest.mark.asyncio
-async def test_update_page_tool(mock_context: Context, mock_page: Any) -> None:
-    """Test update_page tool."""
-    page_id = "12345"
-    title = "Updated Page"
-    content = "<p>Updated content</p>"
-    minor_edit = True
-    content_format = "storage"
-    version_comment = "Updated for testing"
 
+@pytest.mark.error_path
+async def test_get_page_full_tool_error(
+    make_context: Callable[..., Context], mock_page: Page
+) -> None:
+    """Test get_page_full reports a failure of any of its requests."""
+    ctx = make_context(get_page=mock_page, get_comments=[], get_labels=PERMISSION_ERROR)
+
+    result = await PageTools.get_page_full(ctx, "12345")
+
+    assert result == {"status": "error", "message": str(PERMISSION_ERROR)}
+
+
+# SearchTools tests
+
+
+@pytest.mark.happy_path
+@pytest.mark.parametrize(
+    "args,expected_call",
+    [
+        pytest.param(
+            ("test", ["TEST"], "page", 10),
+            {"query": "test", "spaces": ["TEST"], "content_type": "page", "limit": 10},
+            id="explicit",
+        ),
+        pytest.param(
+            ("test search",),
+            {"query": "test search", "spaces": None, "content_type": None, "limit": 10},
+            id="defaults",
+        ),
+        pytest.param(
+            ('text ~ "project documentation"', ["DEV", "TEAM"], "blogpost", 5),
+            {
+                "query": 'text ~ "project documentation"',
+                "spaces": ["DEV", "TEAM"],
+                "content_type": "blogpost",
+                "limit": 5,
+            },
+            id="cql",
+        ),
+    ],
+)
+async def test_search_confluence_tool(
+    mock_context: Context,
+    confluence: AsyncMock,
+    mock_search_result: SearchResult,
+    mock_search_result_dict: Dict[str, Any],
+    args: Tuple[Any, ...],
+    expected_call: Dict[str, Any],
+) -> None:
+    """Test search_confluence tool with default and explicit parameters."""
     # Setup mock response
-    mock_context.request_context.lifespan_context.confluence.update_page.return_value = mock_page
+    confluence.search.return_value = [mock_search_result]
 
     # Call the tool
-    result = await PageTools.update_page(
-        mock_context,
-        page_id,
-        title,
-        content,
-        minor_edit,
-        content_format,
-        version_comment,
-    )
+    result = await SearchTools.search_confluence(mock_context, *args)
 
     # Check that the method was called with the correct arguments
-    mock_context.request_context.lifespan_context.confluence.update_page.assert_called_once_with(
-        page_id=page_id,
-        title=title,
-        content=content,
-        minor_edit=minor_edit,
-        content_format=content_format,
-        version_comment=version_comment,
-    )
+    assert confluence.search.call_args_list == [call(**expected_call)]
 
     # Check the result structure
     assert result["status"] == "success"
-    assert result["page"] == mock_page.__dict__
+    assert result["results"] == [mock_search_result_dict]
+    assert result["count"] == 1
 
 
-@pytest.mark.asyncio
-async def test_update_page_tool_with_defaults(
-    mock_context: Context, mock_page: Any
+@pytest.mark.happy_path
+@pytest.mark.parametrize(
+    "args", [pytest.param((25,), id="explicit"), pytest.param((), id="defaults")]
+)
+async def test_get_spaces_tool(
+    mock_context: Context,
+    confluence: AsyncMock,
+    mock_space: Space,
+    mock_space_dict: Dict[str, Any],
+    args: Tuple[Any, ...],
 ) -> None:
-    """Test update_page tool with default parameters."""
-    page_id = "12345"
-    title = "Updated Page"
-    content = "<p>Updated content</p>"
-
-    # Setup mock response
-    mock_context.request_context.lifespan_context.confluence.update_page.return_value = mock_page
-
-    # Call the tool with minimal parameters
-    result = await PageTools.update_page(
-        mock_context,
-        page_id,
-        title,
-        content,
-    )
-
-    # Check that the method was called with the correct arguments including defaults
-    mock_context.request_context.lifespan_context.confluence.update_page.assert_called_once_with(
-        page_id=page_id,
-        title=title,
-        content=content,
-        minor_edit=False,
-        content_format="storage",
-        version_comment=None,
-    )
-
-    # Check the result structure
-    assert result["status"] == "success"
-    assert result["page"] == mock_page.__dict__
-
-
-@pytest.mark.asyncio
-async def test_update_page_tool_error(mock_context: Context) -> None:
-    """Test update_page tool with error."""
-    page_id = "12345"
-    title = "Updated Page"
-    content = "<p>Updated content</p>"
-    error_message = "Page not found"
-
-    # Setup mock to raise an exception
-    mock_context.request_context.lifespan_context.confluence.update_page.side_effect = (
-        Exception(error_message)
-    )
-
-    # Call the tool
-    result = await PageTools.update_page(
-        mock_context,
-        page_id,
-        title,
-        content,
-    )
-
-    # Check the result structure
-    assert result["status"] == "error"
-    assert result["message"] == error_message
-
-
-@pytest.mark.asyncio
-async def test_delete_page_tool(mock_context: Context) -> None:
-    """Test delete_page tool."""
-    page_id = "12345"
-    expected_result = {"page_id": page_id}
-
+    """Test get_spaces tool with an explicit and the default limit."""
     # Setup mock response
-    mock_context.request_context.lifespan_context.confluence.delete_page.return_value = expected_result
+    confluence.get_spaces.return_value = [mock_space]
 
     # Call the tool
-    result = await PageTools.delete_page(mock_context, page_id)
+    result = await SearchTools.get_spaces(mock_context, *args)
 
     # Check that the method was called with the correct arguments
-    mock_context.request_context.lifespan_context.confluence.delete_page.assert_called_once_with(
-        page_id=page_id,
-    )
+    assert confluence.get_spaces.call_args_list == [
+        call(
+            limit=25,
+        )
+    ]
 
     # Check the result structure
     assert result["status"] == "success"
-    assert result["page_id"] == page_id
-
-
-@pytest.mark.asyncio
-async def test_delete_page_tool_error(mock_context: Context) -> None:
-    """Test delete_page tool with error."""
-    page_id = "12345"
-    error_message = "Page not found"
-
-    # Setup mock to raise an exception
-    mock_context.request_context.lifespan_context.confluence.delete_page.side_effect = (
-        Exception(error_message)
-    )
+    assert result["spaces"] == [mock_space_dict]
+    assert result["count"] == 1
 
-    # Call the tool
-    result = await PageTools.delete_page(mock_context, page_id)
 
-    # Check the result structure
-    assert result["status"] == "error"
-    assert result["message"] == error_message
+# CommentTools tests
 
 
-@pytest.mark.asyncio
-async def test_get_page_children_tool(mock_context: Context, mock_page: Any) -> None:
-    """Test get_page_children tool."""
+@pytest.mark.happy_path
+@pytest.mark.parametrize("depth", ["all", "root"])
+async def test_get_comments_tool(
+    mock_context: Context,
+    confluence: AsyncMock,
+    mock_comment: Comment,
+    mock_comment_dict: Dict[str, Any],
+    depth: str,
+) -> None:
+    """Test get_comments tool with different depth parameters."""
     page_id = "12345"
-    limit = 25
 
     # Setup mock response
-    mock_context.request_context.lifespan_context.confluence.get_page_children.return_value = [
-        mock_page
-    ]
+    confluence.get_comments.return_value = [mock_comment]
 
     # Call the tool
-    result = await PageTools.get_page_children(mock_context, page_id, limit)
+    result = await CommentTools.get_comments(mock_context, page_id, depth)
 
     # Check that the method was called with the correct arguments
-    mock_context.request_context.lifespan_context.confluence.get_page_children.assert_called_once_with(
-        page_id=page_id,
-        limit=limit,
-    )
-
-    # Check the result structure
-    assert result["status"] == "success"
-    assert len(result["children"]) == 1
-    assert result["children"][0] == mock_page.__dict__
-    assert result["count"] == 1
-
-
-@pytest.mark.asyncio
-async def test_get_page_children_tool_with_defaults(
-    mock_context: Context, mock_page: Any
-) -> None:
-    """Test get_page_children tool with default limit."""
-    page_id = "12345"
-
-    # Setup mock response
-    mock_context.request_context.lifespan_context.confluence.get_page_children.return_value = [
-        mock_page
+    assert confluence.get_comments.call_args_list == [
+        call(
+            page_id=page_id,
+            depth=depth,
+        )
     ]
 
-    # Call the tool with default limit
-    result = await PageTools.get_page_children(mock_context, page_id)
-
-    # Check that the method was called with the correct arguments including default limit
-    mock_context.request_context.lifespan_context.confluence.get_page_children.assert_called_once_with(
-        page_id=page_id,
-        limit=25,
-    )
-
     # Check the result structure
     assert result["status"] == "success"
-    assert len(result["children"]) == 1
-    assert result["children"][0] == mock_page.__dict__
+    assert result["comments"] == [mock_comment_dict]
     assert result["count"] == 1
 
 
-@pytest.mark.asyncio
-async def test_get_page_children_tool_empty_result(mock_context: Context) -> None:
-    """Test get_page_children tool with no children."""
-    page_id = "12345"
-
-    # Setup mock response with empty list
-    mock_context.request_context.lifespan_context.confluence.get_page_children.return_value = []
-
-    # Call the tool
-    result = await PageTools.get_page_children(mock_context, page_id)
-
-    # Check the result structure
-    assert result["status"] == "success"
-    assert result["children"] == []
-    assert result["count"] == 0
-
-
-@pytest.mark.asyncio
-async def test_get_page_children_tool_error(mock_context: Context) -> None:
-    """Test get_page_children tool with error."""
-    page_id = "12345"
-    error_message = "Page not found"
-
-    # Setup mock to raise an exception
-    mock_context.request_context.lifespan_context.confluence.get_page_children.side_effect = Exception(
-        error_message
-    )
-
-    # Call the tool
-    result = await PageTools.get_page_children(mock_context, page_id)
-
-    # Check the result structure
-    assert result["status"] == "error"
-    assert result["message"] == error_message
-
-
-@pytest.mark.asyncio
-async def test_get_page_ancestors_tool(mock_context: Context, mock_page: Any) -> None:
-    """Test get_page_ancestors tool."""
+@pytest.mark.happy_path
+async def test_add_comment_tool(
+    mock_context: Context,
+    confluence: AsyncMock,
+    mock_comment: Comment,
+    mock_comment_dict: Dict[str, Any],
+) -> None:
+    """Test add_comment tool."""
     page_id = "12345"
+    content = "This is a test comment"
 
     # Setup mock response
-    mock_context.request_context.lifespan_context.confluence.get_page_ancestors.return_value = [
-        mock_page
-    ]
+    confluence.add_comment.return_value = mock_comment
 
     # Call the tool
-    result = await PageTools.get_page_ancestors(mock_context, page_id)
+    result = await CommentTools.add_comment(mock_context, page_id, content)
 
     # Check that the method was called with the correct arguments
-    mock_context.request_context.lifespan_context.confluence.get_page_ancestors.assert_called_once_with(
-        page_id=page_id,
-    )
-
-    # Check the result structure
-    assert result["status"] == "success"
-    assert len(result["ancestors"]) == 1
-    assert result["ancestors"][0] == mock_page.__dict__
-    assert result["count"] == 1
-
-
-@pytest.mark.asyncio
-async def test_get_page_ancestors_tool_empty_result(mock_context: Context) -> None:
-    """Test get_page_ancestors tool with no ancestors."""
-    page_id = "12345"
-
-    # Setup mock response with empty list
-    mock_context.request_context.lifespan_context.confluence.get_page_ancestors.return_value = []
-
-    # Call the tool
-    result = await PageTools.get_page_ancestors(mock_context, page_id)
+    assert confluence.add_comment.call_args_list == [
+        call(
+            page_id=page_id,
+            content=content,
+        )
+    ]
 
     # Check the result structure
     assert result["status"] == "success"
-    assert result["ancestors"] == []
-    assert result["count"] == 0
-
-
-@pytest.mark.asyncio
-async def test_get_page_ancestors_tool_error(mock_context: Context) -> None:
-    """Test get_page_ancestors tool with error."""
-    page_id = "12345"
-    error_message = "Page not found"
-
-    # Setup mock to raise an exception
-    mock_context.request_context.lifespan_context.confluence.get_page_ancestors.side_effect = Exception(
-        error_message
-    )
-
-    # Call the tool
-    result = await PageTools.get_page_ancestors(mock_context, page_id)
-
-    # Check the result structure
-    assert result["status"] == "error"
-    assert result["message"] == error_message
+    assert result["comment"] == mock_comment_dict
 
 
-@pytest.mark.asyncio
-async def test_get_page_tool_without_body(
-    mock_context: Context, mock_page: Any
+@pytest.mark.happy_path
+async def test_get_labels_tool(
+    mock_context: Context,
+    confluence: AsyncMock,
+    mock_label: Label,
+    mock_label_dict: Dict[str, Any],
 ) -> None:
-    """Test get_page tool without body."""
+    """Test get_labels tool."""
     page_id = "12345"
-    include_body = False
 
     # Setup mock response
-    mock_context.request_context.lifespan_context.confluence.get_page.return_value = (
-        mock_page
-    )
+    confluence.get_labels.return_value = [mock_label]
 
     # Call the tool
-    result = await PageTools.get_page(mock_context, page_id, include_body)
+    result = await CommentTools.get_labels(mock_context, page_id)
 
     # Check that the method was called with the correct arguments
-    mock_context.request_context.lifespan_context.confluence.get_page.assert_called_once_with(
-        page_id=page_id,
-        include_body=include_body,
-    )
+    assert confluence.get_labels.call_args_list == [
+        call(
+            page_id=page_id,
+        )
+    ]
 
     # Check the result structure
     assert result["status"] == "success"
-    assert result["page"] == mock_page.__dict__
+    assert result["labels"] == [mock_label_dict]
+    assert result["count"] == 1
 
 
-@pytest.mark.asyncio
-async def test_create_page_tool_with_parent(
-    mock_context: Context, mock_page: Any
-) -> None:
-    """Test create_page tool with parent page."""
-    space_key = "TEST"
-    title = "Child Page"
-    content = "<p>Child content</p>"
-    parent_id = 67890
-    content_format = "wiki"
+@pytest.mark.happy_path
+async def test_add_label_tool(mock_context: Context, confluence: AsyncMock) -> None:
+    """Test add_label tool."""
+    page_id = "12345"
+    label = "test-label"
+    expected_result = {"status": "success", "label": label, "page_id": page_id}
 
     # Setup mock response
-    mock_context.request_context.lifespan_context.confluence.create_page.return_value = mock_page
+    confluence.add_label.return_value = expected_result
 
     # Call the tool
-    result = await PageTools.create_page(
-        mock_context,
-        title,
-        content,
-        space_key,
-        parent_id,
-        content_format,
-    )
+    result = await CommentTools.add_label(mock_context, page_id, label)
 
     # Check that the method was called with the correct arguments
-    mock_context.request_context.lifespan_context.confluence.create_page.assert_called_once_with(
-        space_key=space_key,
-        title=title,
-        content=content,
-        parent_id=parent_id,
-        content_format=content_format,
-    )
-
-    # Check the result structure
-    assert result["status"] == "success"
-    assert result["page"] == mock_page.__dict__
-
-
-# Additional SearchTools tests for 100% coverage
-
-
-@pytest.mark.asyncio
-async def test_search_confluence_tool_error(mock_context: Context) -> None:
-    """Test search_confluence tool with error."""
-    query = "test"
-    error_message = "Search service unavailable"
-
-    # Setup mock to raise an exception
-    mock_context.request_context.lifespan_context.confluence.search.side_effect = (
-        Exception(error_message)
-    )
-
-    # Call the tool
-    result = await SearchTools.search_confluence(mock_context, query)
-
-    # Check the result structure
-    assert result["status"] == "error"
-    assert result["message"] == error_message
-
-
-@pytest.mark.asyncio
-async def test_get_spaces_tool_error(mock_context: Context) -> None:
-    """Test get_spaces tool with error."""
-    error_message = "Permission denied"
-
-    # Setup mock to raise an exception
-    mock_context.request_context.lifespan_context.confluence.get_spaces.side_effect = (
-        Exception(error_message)
-    )
-
-    # Call the tool
-    result = await SearchTools.get_spaces(mock_context)
-
-    # Check the result structure
-    assert result["status"] == "error"
-    assert result["message"] == error_message
-
-
-@pytest.mark.asyncio
-async def test_search_confluence_tool_with_defaults(
-    mock_context: Context, mock_search_result: Any
-) -> None:
-    """Test search_confluence tool with default parameters."""
-    query = "test search"
-
-    # Setup mock response
-    mock_context.request_context.lifespan_context.confluence.search.return_value = [
-        mock_search_result
+    assert confluence.add_label.call_args_list == [
+        call(
+            page_id=page_id,
+            label=label,
+        )
     ]
 
-    # Call the tool with minimal parameters
-    result = await SearchTools.search_confluence(mock_context, query)
-
-    # Check that the method was called with the correct arguments including defaults
-    mock_context.request_context.lifespan_context.confluence.search.assert_called_once_with(
-        query=query,
-        spaces=None,
-        content_type=None,
-        limit=10,
-    )
-
     # Check the result structure
-    assert result["status"] == "success"
-    assert len(result["results"]) == 1
-    assert result["results"][0] == mock_search_result.__dict__
-    assert result["count"] == 1
-
+    assert result == expected_result
 
-@pytest.mark.asyncio
-async def test_search_confluence_tool_empty_result(mock_context: Context) -> None:
-    """Test search_confluence tool with no results."""
-    query = "nonexistent"
 
-    # Setup mock response with empty list
-    mock_context.request_context.lifespan_context.confluence.search.return_value = []
+# Shared empty-result and error handling tests
+
+
+@pytest.mark.happy_path
+@pytest.mark.parametrize(
+    "tool,args,method,key",
+    [
+        pytest.param(
+            PageTools.get_page_children,
+            ("12345",),
+            "get_page_children",
+            "children",
+            id="get_page_children",
+        ),
+        pytest.param(
+            PageTools.get_page_ancestors,
+            ("12345",),
+            "get_page_ancestors",
+            "ancestors",
+            id="get_page_ancestors",
+        ),
+        pytest.param(
+            SearchTools.search_confluence,
+            ("nonexistent",),
+            "search",
+            "results",
+            id="search_confluence",
+        ),
+        pytest.param(
+            SearchTools.get_spaces, (), "get_spaces", "spaces", id="get_spaces"
+        ),
+        pytest.param(
+            CommentTools.get_comments,
+            ("12345",),
+            "get_comments",
+            "comments",
+            id="get_comments",
+        ),
+        pytest.param(
+            CommentTools.get_labels, ("12345",), "get_labels", "labels", id="get_labels"
+        ),
+    ],
+)
+async def test_tool_empty_result(
+    make_context: Callable[..., Context],
+    tool: Callable[..., Awaitable[Dict[str, Any]]],
+    args: Tuple[Any, ...],
+    method: str,
+    key: str,
+) -> None:
+    """Test that list tools return an empty success result when nothing matches."""
+    ctx = make_context(**{method: []})
+
+    result = await tool(ctx, *args)
+
+    assert result == {"status": "success", key: [], "count": 0}
+
+
+@pytest.mark.error_path
+@pytest.mark.parametrize(
+    "tool,args,method,error",
+    [
+        pytest.param(
+            PageTools.get_page, ("12345",), "get_page", NOT_FOUND_ERROR, id="get_page"
+        ),
+        pytest.param(
+            PageTools.create_page,
+            ("Test Page", "<p>Test content</p>", "TEST"),
+            "create_page",
+            PERMISSION_ERROR,
+            id="create_page",
+        ),
+        pytest.param(
+            PageTools.update_page,
+            ("12345", "Updated Page", "<p>Updated content</p>"),
+            "update_page",
+            NOT_FOUND_ERROR,
+            id="update_page",
+        ),
+        pytest.param(
+            PageTools.delete_page,
+            ("12345",),
+            "delete_page",
+            NOT_FOUND_ERROR,
+            id="delete_page",
+        ),
+        pytest.param(
+            PageTools.get_page_children,
+            ("12345",),
+            "get_page_children",
+            NOT_FOUND_ERROR,
+            id="get_page_children",
+        ),
+        pytest.param(
+            PageTools.get_page_ancestors,
+            ("12345",),
+            "get_page_ancestors",
+            NOT_FOUND_ERROR,
+            id="get_page_ancestors",
+        ),
+        pytest.param(
+            SearchTools.search_confluence,
+            ("test",),
+            "search",
+            SEARCH_ERROR,
+            id="search_confluence",
+        ),
+        pytest.param(
+            SearchTools.get_spaces, (), "get_spaces", PERMISSION_ERROR, id="get_spaces"
+        ),
+        pytest.param(
+            CommentTools.get_comments,
+            ("12345",),
+            "get_comments",
+            NOT_FOUND_ERROR,
+            id="get_comments",
+        ),
+        pytest.param(
+            CommentTools.add_comment,
+            ("12345", "This is a test comment"),
+            "add_comment",
+            PERMISSION_ERROR,
+            id="add_comment",
+        ),
+        pytest.param(
+            CommentTools.get_labels,
+            ("12345",),
+            "get_labels",
+            NOT_FOUND_ERROR,
+            id="get_labels",
+        ),
+        pytest.param(
+            CommentTools.add_label,
+            ("12345", "test-label"),
+            "add_label",
+            PERMISSION_ERROR,
+            id="add_label",
+        ),
+    ],
+)
+async def test_tool_error(
+    make_context: Callable[..., Context],
+    tool: Callable[..., Awaitable[Dict[str, Any]]],
+    args: Tuple[Any, ...],
+    method: str,
+    error: Exception,
+) -> None:
+    """Test that tools return an error result when the client call fails."""
+    ctx = make_context(**{method: error})
 
-    # Call the tool
-    result = await SearchTools.search_confluence(mock_context, query)
+    result = await tool(ctx, *args)
 
-    # Check the result structure
-    assert result["status"] == "success"
-    assert result["results"] == []
-    assert result["count"] == 0
+    assert result == {"status": "error", "message": str(error)}
 
 
-@pytest.mark.asyncio
-async def test_get_spaces_tool_with_defaults(
-    mock_context: Context, mock_space: Any
-) -> None:
-    """Test get_spaces tool with default limit."""
+# Package exports
 
-    # Setup mock response
-    mock_context.request_context.lifespan_context.confluence.get_spaces.return_value = [
-        mock_space
-    ]
 
-    # Call the tool with default limit
-    result = await SearchTools.get_spaces(mock_context)
+@pytest.mark.happy_path
+def test_tools_package_exports() -> None:
+    """Test that the tools package lazily exports the tool classes."""
+    import tools
 
-    # Check that the method was called with the correct arguments including default limit
-    mock_context.request_context.lifespan_context.confluence.get_spaces.assert_called_once_with(
-        limit=25,
-    )
+    assert tools.CommentTools is CommentTools
+    assert tools.PageTools is PageTools
+    assert tools.SearchTools is SearchTools
 
-    # Check the result structure
-    assert result["status"] == "success"
-    assert len(result["spaces"]) == 1
-    assert result["spaces"][0] == mock_space.__dict__
-    assert result["count"] == 1
+    with pytest.raises(AttributeError, match="has no attribute 'MissingTools'"):
+        tools.MissingTools  # noqa: B018
 
 
-@pytest.mark.asyncio
-async def test_get_spaces_tool_empty_result(mock_context: Context) -> None:
-    """Test get_spaces tool with no spaces."""
+@pytest.mark.happy_path
+def test_dataclass_formatter(mock_page: Page, mock_page_dict: Dict[str, Any]) -> None:
+    """Test that responses include only the model's declared fields."""
+    page = replace(mock_page)
+    page.__dict__["cached_body"] = "<p>Not a field</p>"
 
-    # Setup mock response with empty list
-    mock_context.request_context.lifespan_context.confluence.get_spaces.return_value = []
+    assert dataclass_formatter(Page)(page) == mock_page_dict
 
-    # Call the tool
-    result = await SearchTools.get_spaces(mock_context)
 
-    # Check the result structure
-    assert result["status"] == "success"
-    assert result["spaces"] == []
-    assert result["count"] == 0
+@pytest.mark.happy_path
+def test_dumps(mock_page_dict: Dict[str, Any]) -> None:
+    """Test that tool results serialize to compact JSON, including datetimes."""
+    created = datetime(2023, 12, 1, 10, 30, tzinfo=timezone.utc)
+    result = {"status": "success", "page": {**mock_page_dict, "created": created}}
 
+    text = dumps(result)
 
-@pytest.mark.asyncio
-async def test_search_confluence_tool_with_all_parameters(
-    mock_context: Context, mock_search_result: Any
-) -> None:
-    """Test search_confluence tool with all parameters specified."""
-    query = 'text ~ "project documentation"'
-    spaces = ["DEV", "TEAM"]
-    content_type = "blogpost"
-    limit = 5
+    assert "\n" not in text
+    assert json.loads(text) == {
+        "status": "success",
+        "page": {**mock_page_dict, "created": "2023-12-01T10:30:00Z"},
+    }
 
-    # Setup mock response
-    mock_context.request_context.lifespan_context.confluence.search.return_value = [
-        mock_search_result
-    ]
 
-    # Call the tool with all parameters
-    result = await SearchTools.search_confluence(
-        mock_context, query, spaces, content_type, limit
-    )
+@pytest.mark.happy_path
+def test_dumps_unknown_type() -> None:
+    """Test that values JSON cannot represent serialize as their str()."""
 
-    # Check that the method was called with the correct arguments
-    mock_context.request_context.lifespan_context.confluence.search.assert_called_once_with(
-        query=query,
-        spaces=spaces,
-        content_type=content_type,
-        limit=limit,
-    )
+    class Opaque:
+        def __str__(self) -> str:
+            return "opaque"
 
-    # Check the result structure
-    assert result["status"] == "success"
-    assert len(result["results"]) == 1
-    assert result["results"][0] == mock_search_result.__dict__
-    assert result["count"] == 1
+    assert dumps({"value": Opaque()}) == '{"value":"opaque"}'
@@ -1,84 +1,210 @@
 """Tests for update_coverage_badge.py."""
 
 import json
+import os
 from pathlib import Path
-from unittest.mock import mock_open, patch
+from typing import cast
+from unittest.mock import MagicMock, mock_open
 
 import pytest
+from pytest_mock import MockerFixture
 
 from update_coverage_badge import (
+    _load_coverage,
     get_badge_color,
     get_coverage_percentage,
     main,
     update_readme_badge,
 )
 
+# Serialized coverage reports keyed by total coverage percentage
+COVERAGE_PAYLOADS = {
+    percent: json.dumps({"totals": {"percent_covered": percent}}).encode()
+    for percent in (85.4, 85.5, 85.6, 100.0, 0.0, 99.9, 85.67)
+}
+
+# README contents before and after a badge update
+README_WITH_BADGE = """# My Project
+
+![Coverage](https://img.shields.io/badge/coverage-75%25-yellowgreen)
+
+Some content here.
+"""
+
+README_WITH_BADGE_UPDATED = """# My Project
+
+![Coverage](https://img.shields.io/badge/coverage-85%25-green)
+
+Some content here.
+"""
+
+README_WITHOUT_BADGE = """# My Project
+
+Some content here.
+"""
+
+README_WITHOUT_BADGE_UPDATED = """# My Project
+
+![Coverage](https://img.shields.io/badge/coverage-92%25-brightgreen)
+
+Some content here.
+"""
+
+README_MULTIPLE_HEADERS = """# Main Project Title
+
+## Section 1
+
+Some content.
+
+## Section 2
+
+More content.
+"""
+
+README_MULTIPLE_HEADERS_UPDATED = """# Main Project Title
+
+![Coverage](https://img.shields.io/badge/coverage-78%25-yellowgreen)
+
+## Section 1
+
+Some content.
+
+## Section 2
+
+More content.
+"""
+
+README_NO_MAIN_HEADER = """## Section 1
+
+Some content here.
+
+## Section 2
+
+More content.
+"""
+
+README_COMPLEX = """# Complex Project
+
+[![Build Status](https://travis-ci.org/user/repo.svg?branch=main)](https://travis-ci.org/user/repo)
+![Coverage](https://img.shields.io/badge/coverage-67%25-yellow)
+[![License](https://img.shields.io/badge/license-MIT-blue.svg)](LICENSE)
+
+## Description
+
+This is a complex project.
+"""
+
+README_COMPLEX_UPDATED = """# Complex Project
+
+[![Build Status](https://travis-ci.org/user/repo.svg?branch=main)](https://travis-ci.org/user/repo)
+![Coverage](https://img.shields.io/badge/coverage-91%25-brightgreen)
+[![License](https://img.shields.io/badge/license-MIT-blue.svg)](LICENSE)
+
+## Description
+
+This is a complex project.
+"""
+
+README_SHORT = "# Test Project\n\nContent here."
+
+
+@pytest.fixture(autouse=True)
+def clear_coverage_cache() -> None:
+    """Drop coverage reports cached by earlier tests."""
+    _load_coverage.cache_clear()
+
+
+@pytest.fixture
+def mock_path(mocker: MockerFixture) -> MagicMock:
+    """Patch the Path class used by update_coverage_badge."""
+    return cast(MagicMock, mocker.patch("update_coverage_badge.Path"))
+
+
+def stub_readme(mock_path: MagicMock, content: str) -> MagicMock:
+    """Stub README.md with the given content and return its file handle."""
+    mock_readme = mock_path.return_value
+    mock_readme.exists.return_value = True
+    mock_readme.open = mock_open(read_data=content.encode())
+    return cast(MagicMock, mock_readme.open.return_value)
+
 
 class TestGetCoveragePercentage:
     """Test get_coverage_percentage function."""
 
-    def test_get_coverage_percentage_success(self, tmp_path: Path) -> None:
+    def test_get_coverage_percentage_success(self, mock_path: MagicMock) -> None:
         """Test successful coverage percentage retrieval."""
-        # Create a temporary coverage.json file
-        coverage_data = {"totals": {"percent_covered": 85.67}}
-        coverage_file = tmp_path / "coverage.json"
-        coverage_file.write_text(json.dumps(coverage_data))
-
-        # Mock Path to return our temp file
-        with patch("update_coverage_badge.Path") as mock_path_class:
-            mock_path_instance = mock_path_class.return_value
-            mock_path_instance.exists.return_value = True
+        # Mock Path to return a stored coverage report
+        mock_path_instance = mock_path.return_value
+        mock_path_instance.exists.return_value = True
+        mock_path_instance.read_bytes.return_value = COVERAGE_PAYLOADS[85.67]
 
-            with patch("builtins.open", mock_open(read_data=json.dumps(coverage_data))):
-                result = get_coverage_percentage()
+        result = get_coverage_percentage()
 
         assert result == 86  # Should be rounded
 
-    def test_get_coverage_percentage_file_not_found(self) -> None:
+    def test_get_coverage_percentage_file_not_found(
+        self, mock_path: MagicMock, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test when coverage.json file doesn't exist."""
-        with patch("update_coverage_badge.Path") as mock_path:
-            mock_path.return_value.exists.return_value = False
-
-            with pytest.raises(SystemExit) as excinfo:
-                with patch("builtins.print") as mock_print:
-                    get_coverage_percentage()
+        mock_path.return_value.exists.return_value = False
 
-            assert excinfo.value.code == 1
-            mock_print.assert_called_once_with(
-                "coverage.json not found. Run 'uv run pytest' first."
-            )
+        assert get_coverage_percentage() is None
+        out = capsys.readouterr().out
+        assert out == "coverage.json not found. Run 'uv run pytest' first.\n"
 
-    def test_get_coverage_percentage_rounding(self, tmp_path: Path) -> None:
-        """Test rounding of coverage percentage."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "input_percent,expected_output",
+        [
             (85.4, 85),
             (85.5, 86),
             (85.6, 86),
             (100.0, 100),
             (0.0, 0),
             (99.9, 100),
+        ],
+    )
+    def test_get_coverage_percentage_rounding(
+        self, mock_path: MagicMock, input_percent: float, expected_output: int
+    ) -> None:
+        """Test rounding of coverage percentage."""
+        mock_path.return_value.exists.return_value = True
+        mock_path.return_value.read_bytes.return_value = COVERAGE_PAYLOADS[
+            input_percent
         ]
 
-        for input_percent, expected_output in test_cases:
-            coverage_data = {"totals": {"percent_covered": input_percent}}
+        result = get_coverage_percentage()
+
+        assert result == expected_output
+
+    def test_get_coverage_percentage_cached(
+        self, mocker: MockerFixture, mock_path: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test that the report is only re-read when its mtime changes."""
+        coverage_file = tmp_path / "coverage.json"
+        coverage_file.write_text(json.dumps({"totals": {"percent_covered": 85.0}}))
+
+        mock_path.return_value = coverage_file
 
-            with patch("update_coverage_badge.Path") as mock_path:
-                mock_path.return_value.exists.return_value = True
+        assert get_coverage_percentage() == 85
 
-                with patch(
-                    "builtins.open", mock_open(read_data=json.dumps(coverage_data))
-                ):
-                    result = get_coverage_percentage()
+        mock_read_bytes = mocker.patch.object(Path, "read_bytes")
+        assert get_coverage_percentage() == 85
+        mock_read_bytes.assert_not_called()
+        mocker.stop(mock_read_bytes)
 
-                assert result == expected_output
+        mtime_ns = coverage_file.stat().st_mtime_ns
+        coverage_file.write_text(json.dumps({"totals": {"percent_covered": 91.0}}))
+        os.utime(coverage_file, ns=(mtime_ns + 1, mtime_ns + 1))
+
+        assert get_coverage_percentage() == 91
 
 
 class TestGetBadgeColor:
     """Test get_badge_color function."""
 
-    def test_get_badge_color_ranges(self) -> None:
-        """Test badge color for different coverage ranges."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "percentage,expected_color",
+        [
             (95, "brightgreen"),
             (90, "brightgreen"),
             (89, "green"),
@@ -92,285 +218,209 @@ class TestGetBadgeColor:
             (49, "red"),
             (0, "red"),
             (100, "brightgreen"),
-        ]
-
-        for percentage, expected_color in test_cases:
-            result = get_badge_color(percentage)
-            assert (
-                result == expected_color
-            ), f"Expected {expected_color} for {percentage}%, got {result}"
+            (101, "brightgreen"),
+            (-1, "red"),
+        ],
+    )
+    def test_get_badge_color_ranges(self, percentage: int, expected_color: str) -> None:
+        """Test badge color for different coverage ranges."""
+        assert get_badge_color(percentage) == expected_color
 
 
 class TestUpdateReadmeBadge:
     """Test update_readme_badge function."""
 
-    def test_update_readme_badge_file_not_found(self) -> None:
+    def test_update_readme_badge_file_not_found(
+        self, mock_path: MagicMock, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test when README.md file doesn't exist."""
-        with patch("update_coverage_badge.Path") as mock_path:
-            mock_path.return_value.exists.return_value = False
-
-            with pytest.raises(SystemExit) as excinfo:
-                with patch("builtins.print") as mock_print:
-                    update_readme_badge(85)
+        mock_path.return_value.exists.return_value = False
 
-            assert excinfo.value.code == 1
-            mock_print.assert_called_once_with("README.md not found.")
+        assert update_readme_badge(85) is False
+        out = capsys.readouterr().out
+        assert out == "README.md not found.\n"
 
-    def test_update_readme_badge_replace_existing(self) -> None:
+    def test_update_readme_badge_replace_existing(
+        self, mock_path: MagicMock, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test replacing existing coverage badge."""
-        existing_content = """# My Project
+        readme = stub_readme(mock_path, README_WITH_BADGE)
 
-![Coverage](https://img.shields.io/badge/coverage-75%25-yellowgreen)
-
-Some content here.
-"""
-
-        expected_content = """# My Project
-
-![Coverage](https://img.shields.io/badge/coverage-85%25-green)
-
-Some content here.
-"""
-
-        with patch("update_coverage_badge.Path") as mock_path:
-            mock_readme = mock_path.return_value
-            mock_readme.exists.return_value = True
-            mock_readme.read_text.return_value = existing_content
-
-            with patch("builtins.print") as mock_print:
-                update_readme_badge(85)
+        assert update_readme_badge(85) is True
 
-            mock_readme.write_text.assert_called_once_with(expected_content)
-            mock_print.assert_called_once_with(
-                "Updated README.md with coverage badge: 85% (green)"
-            )
+        mock_path.return_value.open.assert_called_once_with("r+b")
+        readme.seek.assert_called_once_with(0)
+        readme.write.assert_called_once_with(README_WITH_BADGE_UPDATED.encode())
+        readme.truncate.assert_called_once_with()
+        out = capsys.readouterr().out
+        assert out == "Updated README.md with coverage badge: 85% (green)\n"
 
-    def test_update_readme_badge_add_new(self) -> None:
+    def test_update_readme_badge_add_new(
+        self, mock_path: MagicMock, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test adding new coverage badge when none exists."""
-        existing_content = """# My Project
+        readme = stub_readme(mock_path, README_WITHOUT_BADGE)
 
-Some content here.
-"""
-
-        expected_content = """# My Project
+        update_readme_badge(92)
 
-![Coverage](https://img.shields.io/badge/coverage-92%25-brightgreen)
-
-Some content here.
-"""
+        readme.write.assert_called_once_with(README_WITHOUT_BADGE_UPDATED.encode())
+        out = capsys.readouterr().out
+        assert out == "Updated README.md with coverage badge: 92% (brightgreen)\n"
 
-        with patch("update_coverage_badge.Path") as mock_path:
-            mock_readme = mock_path.return_value
-            mock_readme.exists.return_value = True
-            mock_readme.read_text.return_value = existing_content
+    def test_update_readme_badge_add_new_crlf(self, mock_path: MagicMock) -> None:
+        """Test a badge added to a CRLF README uses CRLF line endings."""
+        readme = stub_readme(mock_path, README_WITHOUT_BADGE.replace("\n", "\r\n"))
 
-            with patch("builtins.print") as mock_print:
-                update_readme_badge(92)
+        update_readme_badge(92)
 
-            mock_readme.write_text.assert_called_once_with(expected_content)
-            mock_print.assert_called_once_with(
-                "Updated README.md with coverage badge: 92% (brightgreen)"
-            )
+        expected = README_WITHOUT_BADGE_UPDATED.replace("\n", "\r\n")
+        readme.write.assert_called_once_with(expected.encode())
 
-    def test_update_readme_badge_multiple_headers(self) -> None:
+    def test_update_readme_badge_multiple_headers(
+        self, mock_path: MagicMock, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test adding badge after main title when multiple headers exist."""
-        existing_content = """# Main Project Title
-
-## Section 1
-
-Some content.
-
-## Section 2
-
-More content.
-"""
-
-        expected_content = """# Main Project Title
-
-![Coverage](https://img.shields.io/badge/coverage-78%25-yellowgreen)
-
-## Section 1
-
-Some content.
-
-## Section 2
-
-More content.
-"""
-
-        with patch("update_coverage_badge.Path") as mock_path:
-            mock_readme = mock_path.return_value
-            mock_readme.exists.return_value = True
-            mock_readme.read_text.return_value = existing_content
+        readme = stub_readme(mock_path, README_MULTIPLE_HEADERS)
 
-            with patch("builtins.print") as mock_print:
-                update_readme_badge(78)
+        update_readme_badge(78)
 
-            mock_readme.write_text.assert_called_once_with(expected_content)
-            mock_print.assert_called_once_with(
-                "Updated README.md with coverage badge: 78% (yellowgreen)"
-            )
+        readme.write.assert_called_once_with(README_MULTIPLE_HEADERS_UPDATED.encode())
+        out = capsys.readouterr().out
+        assert out == "Updated README.md with coverage badge: 78% (yellowgreen)\n"
 
-    def test_update_readme_badge_no_main_header(self) -> None:
+    def test_update_readme_badge_no_main_header(
+        self, mock_path: MagicMock, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test when no main header exists."""
-        existing_content = """## Section 1
-
-Some content here.
+        # When no main header is found, the badge should not be added
+        readme = stub_readme(mock_path, README_NO_MAIN_HEADER)
 
-## Section 2
+        update_readme_badge(85)
 
-More content.
-"""
+        readme.write.assert_not_called()
+        out = capsys.readouterr().out
+        assert out == "README.md has no main title to add the coverage badge after.\n"
 
-        # When no main header is found, the badge should not be added
-        with patch("update_coverage_badge.Path") as mock_path:
-            mock_readme = mock_path.return_value
-            mock_readme.exists.return_value = True
-            mock_readme.read_text.return_value = existing_content
+    def test_update_readme_badge_unchanged(
+        self, mock_path: MagicMock, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test the README is not rewritten when the badge is already current."""
+        readme = stub_readme(mock_path, README_WITH_BADGE)
 
-            with patch("builtins.print") as mock_print:
-                update_readme_badge(85)
+        assert update_readme_badge(75) is True
 
-            # Should write the original content unchanged
-            mock_readme.write_text.assert_called_once_with(existing_content)
-            mock_print.assert_called_once_with(
-                "Updated README.md with coverage badge: 85% (green)"
-            )
+        readme.write.assert_not_called()
+        readme.truncate.assert_not_called()
+        out = capsys.readouterr().out
+        assert out == "README.md coverage badge unchanged: 75% (yellowgreen)\n"
 
-    def test_update_readme_badge_different_coverage_levels(self) -> None:
-        """Test badge generation for different coverage levels."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "percentage,expected_color",
+        [
             (95, "brightgreen"),
             (85, "green"),
             (75, "yellowgreen"),
             (65, "yellow"),
             (55, "orange"),
             (45, "red"),
-        ]
-
-        existing_content = "# Test Project\n\nContent here."
-
-        for percentage, expected_color in test_cases:
-            expected_badge = f"![Coverage](https://img.shields.io/badge/coverage-{percentage}%25-{expected_color})"
+        ],
+    )
+    def test_update_readme_badge_different_coverage_levels(
+        self,
+        mock_path: MagicMock,
+        percentage: int,
+        expected_color: str,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test badge generation for different coverage levels."""
+        expected_badge = f"![Coverage](https://img.shields.io/badge/coverage-{percentage}%25-{expected_color})"
 
-            with patch("update_coverage_badge.Path") as mock_path:
-                mock_readme = mock_path.return_value
-                mock_readme.exists.return_value = True
-                mock_readme.read_text.return_value = existing_content
+        readme = stub_readme(mock_path, README_SHORT)
 
-                with patch("builtins.print") as mock_print:
-                    update_readme_badge(percentage)
+        update_readme_badge(percentage)
 
-                written_content = mock_readme.write_text.call_args[0][0]
-                assert expected_badge in written_content
-                mock_print.assert_called_with(
-                    f"Updated README.md with coverage badge: {percentage}% ({expected_color})"
-                )
+        written_content = readme.write.call_args[0][0]
+        assert expected_badge.encode() in written_content
+        out = capsys.readouterr().out
+        assert out == (
+            f"Updated README.md with coverage badge: {percentage}% ({expected_color})\n"
+        )
 
-    def test_update_readme_badge_complex_existing_badge(self) -> None:
+    def test_update_readme_badge_complex_existing_badge(
+        self, mock_path: MagicMock, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test replacing existing badge with complex README structure."""
-        existing_content = """# Complex Project
-
-[![Build Status](https://travis-ci.org/user/repo.svg?branch=main)](https://travis-ci.org/user/repo)
-![Coverage](https://img.shields.io/badge/coverage-67%25-yellow)
-[![License](https://img.shields.io/badge/license-MIT-blue.svg)](LICENSE)
-
-## Description
-
-This is a complex project.
-"""
-
-        expected_content = """# Complex Project
-
-[![Build Status](https://travis-ci.org/user/repo.svg?branch=main)](https://travis-ci.org/user/repo)
-![Coverage](https://img.shields.io/badge/coverage-91%25-brightgreen)
-[![License](https://img.shields.io/badge/license-MIT-blue.svg)](LICENSE)
-
-## Description
-
-This is a complex project.
-"""
+        readme = stub_readme(mock_path, README_COMPLEX)
 
-        with patch("update_coverage_badge.Path") as mock_path:
-            mock_readme = mock_path.return_value
-            mock_readme.exists.return_value = True
-            mock_readme.read_text.return_value = existing_content
+        update_readme_badge(91)
 
-            with patch("builtins.print") as mock_print:
-                update_readme_badge(91)
-
-            mock_readme.write_text.assert_called_once_with(expected_content)
-            mock_print.assert_called_once_with(
-                "Updated README.md with coverage badge: 91% (brightgreen)"
-            )
+        readme.write.assert_called_once_with(README_COMPLEX_UPDATED.encode())
+        out = capsys.readouterr().out
+        assert out == "Updated README.md with coverage badge: 91% (brightgreen)\n"
 
 
 class TestMain:
     """Test main function."""
 
-    def test_main_success(self) -> None:
+    def test_main_success(self, mocker: MockerFixture) -> None:
         """Test successful main function execution."""
-        with patch(
-            "update_coverage_badge.get_coverage_percentage"
-        ) as mock_get_coverage:
-            with patch(
-                "update_coverage_badge.update_readme_badge"
-            ) as mock_update_badge:
-                mock_get_coverage.return_value = 88
+        mock_get_coverage = mocker.patch(
+            "update_coverage_badge.get_coverage_percentage", return_value=88
+        )
+        mock_update_badge = mocker.patch(
+            "update_coverage_badge.update_readme_badge", return_value=True
+        )
 
-                main()
+        main()
 
-                mock_get_coverage.assert_called_once()
-                mock_update_badge.assert_called_once_with(88)
+        mock_get_coverage.assert_called_once()
+        mock_update_badge.assert_called_once_with(88)
 
-    def test_main_with_coverage_file_error(self) -> None:
+    def test_main_with_coverage_file_error(self, mocker: MockerFixture) -> None:
         """Test main function when coverage file is missing."""
-        with patch(
-            "update_coverage_badge.get_coverage_percentage"
-        ) as mock_get_coverage:
-            mock_get_coverage.side_effect = SystemExit(1)
+        mock_get_coverage = mocker.patch(
+            "update_coverage_badge.get_coverage_percentage", return_value=None
+        )
+        mock_update_badge = mocker.patch("update_coverage_badge.update_readme_badge")
 
-            with pytest.raises(SystemExit) as excinfo:
-                main()
+        with pytest.raises(SystemExit) as excinfo:
+            main()
 
-            assert excinfo.value.code == 1
-            mock_get_coverage.assert_called_once()
+        assert excinfo.value.code == 1
+        mock_get_coverage.assert_called_once()
+        mock_update_badge.assert_not_called()
 
-    def test_main_with_readme_error(self) -> None:
+    def test_main_with_readme_error(self, mocker: MockerFixture) -> None:
         """Test main function when README file is missing."""
-        with patch(
-            "update_coverage_badge.get_coverage_percentage"
-        ) as mock_get_coverage:
-            with patch(
-                "update_coverage_badge.update_readme_badge"
-            ) as mock_update_badge:
-                mock_get_coverage.return_value = 75
-                mock_update_badge.side_effect = SystemExit(1)
-
-                with pytest.raises(SystemExit) as excinfo:
-                    main()
+        mock_get_coverage = mocker.patch(
+            "update_coverage_badge.get_coverage_percentage", return_value=75
+        )
+        mock_update_badge = mocker.patch(
+            "update_coverage_badge.update_readme_badge", return_value=False
+        )
+
+        with pytest.raises(SystemExit) as excinfo:
+            main()
 
-                assert excinfo.value.code == 1
-                mock_get_coverage.assert_called_once()
-                mock_update_badge.assert_called_once_with(75)
+        assert excinfo.value.code == 1
+        mock_get_coverage.assert_called_once()
+        mock_update_badge.assert_called_once_with(75)
 
 
 class TestIntegration:
     """Integration tests."""
 
-    def test_full_workflow_with_temp_files(self, tmp_path: Path) -> None:
+    def test_full_workflow_with_temp_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test the full workflow with temporary files."""
-        # Set up temporary directory
-        original_cwd = Path.cwd()
-
-        try:
-            # Create coverage.json
-            coverage_data = {"totals": {"percent_covered": 87.3}}
-            coverage_file = tmp_path / "coverage.json"
-            coverage_file.write_text(json.dumps(coverage_data))
+        # Create coverage.json
+        coverage_data = {"totals": {"percent_covered": 87.3}}
+        coverage_file = tmp_path / "coverage.json"
+        coverage_file.write_text(json.dumps(coverage_data))
 
-            # Create README.md
-            readme_content = """# Test Project
+        # Create README.md
+        readme_content = """# Test Project
 
 Some description here.
 
@@ -378,61 +428,39 @@ Some description here.
 
 Run `pip install`.
 """
-            readme_file = tmp_path / "README.md"
-            readme_file.write_text(readme_content)
-
-            # Change to temp directory
-            import os
-
-            os.chdir(tmp_path)
-
-            # Run the main function
-            main()
-
-            # Check results
-            updated_readme = readme_file.read_text()
-            assert (
-                "![Coverage](https://img.shields.io/badge/coverage-87%25-green)"
-                in updated_readme
-            )
-            assert "# Test Project" in updated_readme
-            assert "Some description here." in updated_readme
-
-        finally:
-            # Restore original directory
-            import os
-
-            os.chdir(original_cwd)
-
-    def test_edge_case_empty_readme(self, tmp_path: Path) -> None:
+        readme_file = tmp_path / "README.md"
+        readme_file.write_text(readme_content)
+
+        # Run the main function from the temp directory
+        monkeypatch.chdir(tmp_path)
+        main()
+
+        # Check results
+        updated_readme = readme_file.read_text()
+        assert (
+            "![Coverage](https://img.shields.io/badge/coverage-87%25-green)"
+            in updated_readme
+        )
+        assert "# Test Project" in updated_readme
+        assert "Some description here." in updated_readme
+
+    def test_edge_case_empty_readme(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test edge case with empty README."""
-        # Set up temporary directory
-        original_cwd = Path.cwd()
-
-        try:
-            # Create coverage.json
-            coverage_data = {"totals": {"percent_covered": 100.0}}
-            coverage_file = tmp_path / "coverage.json"
-            coverage_file.write_text(json.dumps(coverage_data))
-
-            # Create empty README.md
-            readme_file = tmp_path / "README.md"
-            readme_file.write_text("")
-
-            # Change to temp directory
-            import os
-
-            os.chdir(tmp_path)
-
-            # Run the main function
-            main()
+        # Create coverage.json
+        coverage_data = {"totals": {"percent_covered": 100.0}}
+        coverage_file = tmp_path / "coverage.json"
+        coverage_file.write_text(json.dumps(coverage_data))
 
-            # Check results - badge should not be added to empty file
-            updated_readme = readme_file.read_text()
-            assert updated_readme == ""  # Should remain empty
+        # Create empty README.md
+        readme_file = tmp_path / "README.md"
+        readme_file.write_text("")
 
-        finally:
-            # Restore original directory
-            import os
+        # Run the main function from the temp directory
+        monkeypatch.chdir(tmp_path)
+        main()
 
-            os.chdir(original_cwd)
+        # Check results - badge should not be added to empty file
+        updated_readme = readme_file.read_text()
+        assert updated_readme == ""  # Should remain empty
@@ -1,13 +1,15 @@
 """Tests for Confluence utility functions."""
 
-from datetime import datetime
-from typing import Any, Dict
-from unittest.mock import patch
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict
 
 import pytest
+from pytest_mock import MockerFixture
 
 from confluence.models import Comment, Label, Page, SearchResult, Space
 from confluence.utils import (
+    _PARSERS,
+    _parse_iso_datetime,
     parse_comment_response,
     parse_confluence_response,
     parse_datetime,
@@ -17,7 +19,23 @@ from confluence.utils import (
     parse_space_response,
 )
 
+# Parsed models returned by the patched per-model parsers
+PAGE_PROTO = Page(id="123", title="Test Page", space_key="", version=1)
+COMMENT_PROTO = Comment(id="123", page_id="", content="Test comment")
+SPACE_PROTO = Space(id=123, key="TEST", name="Test Space", type="")
+SEARCH_RESULT_PROTO = SearchResult(
+    id="123", title="Test Result", space_key="", content_type="", excerpt=""
+)
+LABEL_PROTO = Label(id="123", name="test-label", prefix="", label="")
+
+
+@pytest.fixture(autouse=True)
+def clear_datetime_cache() -> None:
+    """Drop timestamps cached by earlier tests."""
+    _parse_iso_datetime.cache_clear()
 
+
+@pytest.mark.xdist_group(name="parse_datetime")
 class TestParseDatetime:
     """Test parse_datetime function."""
 
@@ -52,18 +70,36 @@ class TestParseDatetime:
         result = parse_datetime("")
         assert result is None
 
-    @patch("confluence.utils.logger")
-    def test_parse_datetime_invalid_format(self, mock_logger: Any) -> None:
+    def test_parse_datetime_invalid_format(self, mocker: MockerFixture) -> None:
         """Test parsing invalid datetime format."""
+        mock_logger = mocker.patch("confluence.utils.logger")
         date_str = "invalid-date"
         result = parse_datetime(date_str)
 
         assert result is None
         mock_logger.warning.assert_called_once()
 
-    @patch("confluence.utils.logger")
-    def test_parse_datetime_type_error(self, mock_logger: Any) -> None:
+    def test_parse_datetime_cached(self) -> None:
+        """Test that repeated timestamps are parsed once."""
+        date_str = "2023-12-01T10:30:00.000Z"
+
+        assert parse_datetime(date_str) is parse_datetime(date_str)
+        assert _parse_iso_datetime.cache_info().hits == 1
+
+    def test_parse_datetime_invalid_format_not_cached(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test that an invalid timestamp is reported on every call."""
+        mock_logger = mocker.patch("confluence.utils.logger")
+
+        assert parse_datetime("invalid-date") is None
+        assert parse_datetime("invalid-date") is None
+
+        assert mock_logger.warning.call_count == 2
+
+    def test_parse_datetime_type_error(self, mocker: MockerFixture) -> None:
         """Test parsing when TypeError occurs."""
+        mock_logger = mocker.patch("confluence.utils.logger")
         # Passing an int instead of string should cause TypeError
         result = parse_datetime(123)  # type: ignore
 
@@ -71,73 +107,64 @@ class TestParseDatetime:
         mock_logger.warning.assert_called_once()
 
 
+@pytest.mark.xdist_group(name="parse_dispatch")
 class TestParseConfluenceResponse:
     """Test parse_confluence_response function."""
 
-    def test_parse_page_response(self) -> None:
+    def test_parse_page_response(self, mocker: MockerFixture) -> None:
         """Test parsing response as Page."""
         response = {"id": "123", "title": "Test Page"}
 
-        with patch("confluence.utils.parse_page_response") as mock_parse:
-            mock_parse.return_value = Page(
-                id="123", title="Test Page", space_key="", version=1
-            )
-            result = parse_confluence_response(response, Page)
+        mock_parse = mocker.Mock(return_value=PAGE_PROTO)
+        mocker.patch.dict(_PARSERS, {Page: mock_parse})
+        result = parse_confluence_response(response, Page)
 
-            mock_parse.assert_called_once_with(response)
-            assert isinstance(result, Page)
+        mock_parse.assert_called_once_with(response)
+        assert result is PAGE_PROTO
 
-    def test_parse_comment_response(self) -> None:
+    def test_parse_comment_response(self, mocker: MockerFixture) -> None:
         """Test parsing response as Comment."""
         response = {"id": "123", "content": "Test comment"}
 
-        with patch("confluence.utils.parse_comment_response") as mock_parse:
-            mock_parse.return_value = Comment(
-                id="123", page_id="", content="Test comment"
-            )
-            result = parse_confluence_response(response, Comment)
+        mock_parse = mocker.Mock(return_value=COMMENT_PROTO)
+        mocker.patch.dict(_PARSERS, {Comment: mock_parse})
+        result = parse_confluence_response(response, Comment)
 
-            mock_parse.assert_called_once_with(response)
-            assert isinstance(result, Comment)
+        mock_parse.assert_called_once_with(response)
+        assert result is COMMENT_PROTO
 
-    def test_parse_space_response(self) -> None:
+    def test_parse_space_response(self, mocker: MockerFixture) -> None:
         """Test parsing response as Space."""
         response = {"id": 123, "key": "TEST", "name": "Test Space"}
 
-        with patch("confluence.utils.parse_space_response") as mock_parse:
-            mock_parse.return_value = Space(
-                id=123, key="TEST", name="Test Space", type=""
-            )
-            result = parse_confluence_response(response, Space)
+        mock_parse = mocker.Mock(return_value=SPACE_PROTO)
+        mocker.patch.dict(_PARSERS, {Space: mock_parse})
+        result = parse_confluence_response(response, Space)
 
-            mock_parse.assert_called_once_with(response)
-            assert isinstance(result, Space)
+        mock_parse.assert_called_once_with(response)
+        assert result is SPACE_PROTO
 
-    def test_parse_search_result_response(self) -> None:
+    def test_parse_search_result_response(self, mocker: MockerFixture) -> None:
         """Test parsing response as SearchResult."""
         response = {"id": "123", "title": "Test Result"}
 
-        with patch("confluence.utils.parse_search_result_response") as mock_parse:
-            mock_parse.return_value = SearchResult(
-                id="123", title="Test Result", space_key="", content_type="", excerpt=""
-            )
-            result = parse_confluence_response(response, SearchResult)
+        mock_parse = mocker.Mock(return_value=SEARCH_RESULT_PROTO)
+        mocker.patch.dict(_PARSERS, {SearchResult: mock_parse})
+        result = parse_confluence_response(response, SearchResult)
 
-            mock_parse.assert_called_once_with(response)
-            assert isinstance(result, SearchResult)
+        mock_parse.assert_called_once_with(response)
+        assert result is SEARCH_RESULT_PROTO
 
-    def test_parse_label_response(self) -> None:
+    def test_parse_label_response(self, mocker: MockerFixture) -> None:
         """Test parsing response as Label."""
         response = {"id": "123", "name": "test-label"}
 
-        with patch("confluence.utils.parse_label_response") as mock_parse:
-            mock_parse.return_value = Label(
-                id="123", name="test-label", prefix="", label=""
-            )
-            result = parse_confluence_response(response, Label)
+        mock_parse = mocker.Mock(return_value=LABEL_PROTO)
+        mocker.patch.dict(_PARSERS, {Label: mock_parse})
+        result = parse_confluence_response(response, Label)
 
-            mock_parse.assert_called_once_with(response)
-            assert isinstance(result, Label)
+        mock_parse.assert_called_once_with(response)
+        assert result is LABEL_PROTO
 
     def test_parse_unsupported_model_type(self) -> None:
         """Test parsing with unsupported model type."""
@@ -150,12 +177,11 @@ class TestParseConfluenceResponse:
             parse_confluence_response(response, UnsupportedModel)  # type: ignore
 
 
-class TestParsePageResponse:
-    """Test parse_page_response function."""
-
-    def test_parse_complete_page_response(self) -> None:
-        """Test parsing complete page response."""
-        response = {
+# (parser, response, expected attributes) for each response parser
+PARSE_CASES = [
+    pytest.param(
+        parse_page_response,
+        {
             "id": "123456",
             "title": "Test Page",
             "space": {"key": "TEST"},
@@ -165,54 +191,48 @@ class TestParsePageResponse:
             "lastUpdated": "2023-12-02T15:45:00.000Z",
             "history": {"createdBy": {"displayName": "John Doe"}},
             "_links": {"webui": "/pages/123456"},
-        }
-
-        result = parse_page_response(response)
-
-        assert result.id == "123456"
-        assert result.title == "Test Page"
-        assert result.space_key == "TEST"
-        assert result.version == 5
-        assert result.content == "<p>Page content</p>"
-        assert result.created is not None
-        assert result.updated is not None
-        assert result.url == "/pages/123456"
-
-    def test_parse_minimal_page_response(self) -> None:
-        """Test parsing minimal page response with defaults."""
-        response: Dict[str, Any] = {}
-
-        result = parse_page_response(response)
-
-        assert result.id == ""
-        assert result.title == ""
-        assert result.space_key == ""
-        assert result.version == 0
-        assert result.content is None
-        assert result.created is None
-        assert result.updated is None
-        assert result.url == ""
-
-    def test_parse_page_response_without_body(self) -> None:
-        """Test parsing page response without body content."""
-        response = {
+        },
+        {
+            "id": "123456",
+            "title": "Test Page",
+            "space_key": "TEST",
+            "version": 5,
+            "content": "<p>Page content</p>",
+            "created": datetime(2023, 12, 1, 10, 30, tzinfo=timezone.utc),
+            "updated": datetime(2023, 12, 2, 15, 45, tzinfo=timezone.utc),
+            "url": "/pages/123456",
+        },
+        id="page-complete",
+    ),
+    pytest.param(
+        parse_page_response,
+        {},
+        {
+            "id": "",
+            "title": "",
+            "space_key": "",
+            "version": 0,
+            "content": None,
+            "created": None,
+            "updated": None,
+            "url": "",
+        },
+        id="page-minimal",
+    ),
+    pytest.param(
+        parse_page_response,
+        {
             "id": "123",
             "title": "Test Page",
             "space": {"key": "TEST"},
             "version": {"number": 1},
-        }
-
-        result = parse_page_response(response)
-
-        assert result.content is None
-
-
-class TestParseCommentResponse:
-    """Test parse_comment_response function."""
-
-    def test_parse_complete_comment_response(self) -> None:
-        """Test parsing complete comment response."""
-        response = {
+        },
+        {"content": None},
+        id="page-without-body",
+    ),
+    pytest.param(
+        parse_comment_response,
+        {
             "id": "comment123",
             "container": {"id": "page456"},
             "body": {"storage": {"value": "<p>Comment content</p>"}},
@@ -220,49 +240,43 @@ class TestParseCommentResponse:
             "lastUpdated": "2023-12-01T11:00:00.000Z",
             "author": {"displayName": "Jane Doe"},
             "parent": {"id": "comment100"},
-        }
-
-        result = parse_comment_response(response)
-
-        assert result.id == "comment123"
-        assert result.page_id == "page456"
-        assert result.content == "<p>Comment content</p>"
-        assert result.created is not None
-        assert result.updated is not None
-        assert result.parent_comment_id == "comment100"
-
-    def test_parse_minimal_comment_response(self) -> None:
-        """Test parsing minimal comment response."""
-        response: Dict[str, Any] = {}
-
-        result = parse_comment_response(response)
-
-        assert result.id == ""
-        assert result.page_id == ""
-        assert result.content == ""
-        assert result.created is None
-        assert result.updated is None
-        assert result.parent_comment_id is None
-
-    def test_parse_comment_response_without_parent(self) -> None:
-        """Test parsing comment response without parent."""
-        response = {
+        },
+        {
+            "id": "comment123",
+            "page_id": "page456",
+            "content": "<p>Comment content</p>",
+            "created": datetime(2023, 12, 1, 10, 30, tzinfo=timezone.utc),
+            "updated": datetime(2023, 12, 1, 11, 0, tzinfo=timezone.utc),
+            "parent_comment_id": "comment100",
+        },
+        id="comment-complete",
+    ),
+    pytest.param(
+        parse_comment_response,
+        {},
+        {
+            "id": "",
+            "page_id": "",
+            "content": "",
+            "created": None,
+            "updated": None,
+            "parent_comment_id": None,
+        },
+        id="comment-minimal",
+    ),
+    pytest.param(
+        parse_comment_response,
+        {
             "id": "comment123",
             "container": {"id": "page456"},
             "body": {"storage": {"value": "Comment content"}},
-        }
-
-        result = parse_comment_response(response)
-
-        assert result.parent_comment_id is None
-
-
-class TestParseSpaceResponse:
-    """Test parse_space_response function."""
-
-    def test_parse_complete_space_response(self) -> None:
-        """Test parsing complete space response."""
-        response = {
+        },
+        {"parent_comment_id": None},
+        id="comment-without-parent",
+    ),
+    pytest.param(
+        parse_space_response,
+        {
             "id": 123,
             "key": "TEST",
             "name": "Test Space",
@@ -270,65 +284,41 @@ class TestParseSpaceResponse:
             "description": {"plain": {"value": "Test space description"}},
             "homepage": {"id": "home123"},
             "status": "current",
-        }
-
-        result = parse_space_response(response)
-
-        assert result.id == 123
-        assert result.key == "TEST"
-        assert result.name == "Test Space"
-        assert result.type == "global"
-        assert result.description == "Test space description"
-        assert result.homepage_id == "home123"
-        assert result.status == "current"
-
-    def test_parse_minimal_space_response(self) -> None:
-        """Test parsing minimal space response."""
-        response: Dict[str, Any] = {}
-
-        result = parse_space_response(response)
-
-        assert result.id == 0
-        assert result.key == ""
-        assert result.name == ""
-        assert result.type == ""
-        assert result.description is None
-        assert result.homepage_id is None
-        assert result.status == ""
-
-    def test_parse_space_response_without_description(self) -> None:
-        """Test parsing space response without description."""
-        response = {
-            "id": 123,
-            "key": "TEST",
-            "name": "Test Space",
-            "type": "global",
-        }
-
-        result = parse_space_response(response)
-
-        assert result.description is None
-
-    def test_parse_space_response_without_homepage(self) -> None:
-        """Test parsing space response without homepage."""
-        response = {
+        },
+        {
             "id": 123,
             "key": "TEST",
             "name": "Test Space",
             "type": "global",
-        }
-
-        result = parse_space_response(response)
-
-        assert result.homepage_id is None
-
-
-class TestParseSearchResultResponse:
-    """Test parse_search_result_response function."""
-
-    def test_parse_complete_search_result_response(self) -> None:
-        """Test parsing complete search result response."""
-        response = {
+            "description": "Test space description",
+            "homepage_id": "home123",
+            "status": "current",
+        },
+        id="space-complete",
+    ),
+    pytest.param(
+        parse_space_response,
+        {},
+        {
+            "id": 0,
+            "key": "",
+            "name": "",
+            "type": "",
+            "description": None,
+            "homepage_id": None,
+            "status": "",
+        },
+        id="space-minimal",
+    ),
+    pytest.param(
+        parse_space_response,
+        {"id": 123, "key": "TEST", "name": "Test Space", "type": "global"},
+        {"description": None, "homepage_id": None},
+        id="space-without-description-and-homepage",
+    ),
+    pytest.param(
+        parse_search_result_response,
+        {
             "id": "result123",
             "title": "Search Result",
             "space": {"key": "TEST"},
@@ -338,37 +328,63 @@ class TestParseSearchResultResponse:
             "created": "2023-12-01T10:30:00.000Z",
             "lastUpdated": "2023-12-02T15:45:00.000Z",
             "_links": {"webui": "/pages/result123"},
-        }
-
-        result = parse_search_result_response(response)
-
-        assert result.id == "result123"
-        assert result.title == "Search Result"
-        assert result.space_key == "TEST"
-        assert result.content_type == "page"
-        assert result.excerpt == "This is a search result excerpt"
-        assert result.content == "<p>Full content</p>"
-        assert result.created is not None
-        assert result.updated is not None
-        assert result.url == "/pages/result123"
-
-    def test_parse_minimal_search_result_response(self) -> None:
-        """Test parsing minimal search result response."""
-        response: Dict[str, Any] = {}
-
-        result = parse_search_result_response(response)
-
-        assert result.id == ""
-        assert result.title == ""
-        assert result.space_key == ""
-        assert result.content_type == ""
-        assert result.excerpt == ""
-        assert result.content is None
-        assert result.created is None
-        assert result.updated is None
-        assert result.url == ""
-
-
+        },
+        {
+            "id": "result123",
+            "title": "Search Result",
+            "space_key": "TEST",
+            "content_type": "page",
+            "excerpt": "This is a search result excerpt",
+            "content": "<p>Full content</p>",
+            "created": datetime(2023, 12, 1, 10, 30, tzinfo=timezone.utc),
+            "updated": datetime(2023, 12, 2, 15, 45, tzinfo=timezone.utc),
+            "url": "/pages/result123",
+        },
+        id="search-result-complete",
+    ),
+    pytest.param(
+        parse_search_result_response,
+        {},
+        {
+            "id": "",
+            "title": "",
+            "space_key": "",
+            "content_type": "",
+            "excerpt": "",
+            "content": None,
+            "created": None,
+            "updated": None,
+            "url": "",
+        },
+        id="search-result-minimal",
+    ),
+    pytest.param(
+        parse_search_result_response,
+        {"body": {"view": {}}},
+        {"content": ""},
+        id="search-result-empty-view",
+    ),
+]
+
+
+@pytest.mark.xdist_group(name="parse_response")
+class TestParseResponse:
+    """Test the page, comment, space and search result parsers."""
+
+    @pytest.mark.parametrize("parser,response,expected", PARSE_CASES)
+    def test_parse_response(
+        self,
+        parser: Callable[[Dict[str, Any]], Any],
+        response: Dict[str, Any],
+        expected: Dict[str, Any],
+    ) -> None:
+        """Test each parser maps the response onto the expected attributes."""
+        result = parser(response)
+
+        assert {name: getattr(result, name) for name in expected} == expected
+
+
+@pytest.mark.xdist_group(name="parse_label")
 class TestParseLabelResponse:
     """Test parse_label_response function."""
 
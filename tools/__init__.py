@@ -1,7 +1,29 @@
 """Tools module initialization."""
 
-from tools.comment_tools import CommentTools
-from tools.page_tools import PageTools
-from tools.search_tools import SearchTools
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from tools.comment_tools import CommentTools
+    from tools.page_tools import PageTools
+    from tools.search_tools import SearchTools
 
 __all__ = ["PageTools", "SearchTools", "CommentTools"]
+
+# Submodule defining each exported tool class, imported on first access
+_MODULES = {
+    "CommentTools": "tools.comment_tools",
+    "PageTools": "tools.page_tools",
+    "SearchTools": "tools.search_tools",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a tool class the first time it is accessed."""
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,238 @@
+"""Time-to-live memoization for read-only Confluence tools."""
+
+import asyncio
+import functools
+import heapq
+import inspect
+import itertools
+from collections import OrderedDict
+from time import monotonic
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Dict[str, Any]]])
+
+# Returned by TTLCache.get when a key is absent or expired
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Bounded least-recently-used cache whose entries expire after a fixed TTL.
+
+    Entries may be tagged with the IDs of the pages they describe so that
+    writes to a page can purge every cached read of it. Each invalidation
+    also bumps the cache's generation, which lets a read that was already in
+    flight tell that its result may predate the write.
+    """
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # key -> (expiry, page IDs, value), oldest use first
+        self._entries: "OrderedDict[Hashable, Tuple[float, FrozenSet[str], Any]]" = (
+            OrderedDict()
+        )
+        # (expiry, insertion order, key); stale items are skipped when popped
+        self._expiries: List[Tuple[float, int, Hashable]] = []
+        self._counter = itertools.count()
+        # key -> (page ID, task fetching it), shared by every concurrent caller
+        self.inflight: Dict[Hashable, Tuple[Optional[str], "asyncio.Future[Any]"]] = {}
+        # Bumped by every invalidation
+        self.generation = 0
+
+    def __len__(self) -> int:
+        self._expire()
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for key, or _MISSING."""
+        self._expire()
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        self._entries.move_to_end(key)
+        return entry[2]
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        page_id: Optional[str] = None,
+        ttl: Optional[float] = None,
+        related_ids: Iterable[str] = (),
+    ) -> None:
+        """Cache value under key for ttl seconds, evicting the least recently used."""
+        expiry = monotonic() + (self.ttl if ttl is None else ttl)
+        page_ids = frozenset(related_ids)
+        if page_id is not None:
+            page_ids |= {page_id}
+        self._entries[key] = (expiry, page_ids, value)
+        self._entries.move_to_end(key)
+        heapq.heappush(self._expiries, (expiry, next(self._counter), key))
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, page_id: str) -> None:
+        """Drop every entry and in-flight read tagged with page_id."""
+        self.generation += 1
+        stale = [key for key, entry in self._entries.items() if page_id in entry[1]]
+        for key in stale:
+            del self._entries[key]
+        stale = [key for key, item in self.inflight.items() if item[0] == page_id]
+        for key in stale:
+            del self.inflight[key]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self.generation += 1
+        self._entries.clear()
+        self._expiries.clear()
+
+    def _expire(self) -> None:
+        """Drop entries whose TTL has passed."""
+        now = monotonic()
+        while self._expiries and self._expiries[0][0] <= now:
+            expiry, _, key = heapq.heappop(self._expiries)
+            entry = self._entries.get(key)
+            # Skip keys that were evicted, invalidated or set again since
+            if entry is not None and entry[0] == expiry:
+                del self._entries[key]
+
+
+# Every cache created by ttl_cache, so writes can purge them all
+_CACHES: List[TTLCache] = []
+
+
+def _is_not_found(exc: BaseException) -> bool:
+    """Return whether exc reports a 404 response from the Confluence API."""
+    # atlassian-python-api wraps the requests HTTPError of a 404 in ApiError.reason
+    response = getattr(exc, "response", None)
+    if response is None:
+        response = getattr(getattr(exc, "reason", None), "response", None)
+    status_code: Optional[int] = getattr(response, "status_code", None)
+    return status_code == 404
+
+
+def ttl_cache(
+    ttl: float = 30,
+    maxsize: int = 512,
+    negative_ttl: Optional[float] = None,
+    related_ids: Optional[Callable[[Dict[str, Any]], Iterable[str]]] = None,
+) -> Callable[[F], F]:
+    """
+    Memoize a tool's successful results for ttl seconds.
+
+    The cache key is built from the tool's arguments other than ctx, with
+    defaults applied, so equivalent calls share an entry. Concurrent calls
+    with the same key share a single in-flight request to the Confluence API,
+    including its exception when that fails. Errors are not cached, except
+    that a 404 is remembered for negative_ttl seconds when that is set. A
+    result is not cached either when a page was invalidated while it was
+    being fetched, as it may predate that write. Apply it beneath
+    tool_endpoint, which turns the raised exception into each caller's error
+    result.
+
+    Args:
+        ttl: Seconds a result stays cached
+        maxsize: Maximum number of cached results
+        negative_ttl: Seconds a 404 stays cached, or None to never cache it
+        related_ids: Function returning the IDs of other pages a result lists,
+            whose writes should purge it as well as writes to its own page_id
+
+    Returns:
+        Decorator for an async tool function
+    """
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+        cache = TTLCache(ttl=ttl, maxsize=maxsize)
+        _CACHES.append(cache)
+
+        async def fill(
+            key: Hashable,
+            page_id: Optional[str],
+            args: Tuple[Any, ...],
+            kwargs: Dict[str, Any],
+        ) -> Dict[str, Any]:
+            generation = cache.generation
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                if (
+                    negative_ttl is not None
+                    and _is_not_found(e)
+                    and cache.generation == generation
+                ):
+                    cache.set(key, e, page_id=page_id, ttl=negative_ttl)
+                raise
+            if result.get("status") == "success" and cache.generation == generation:
+                cache.set(
+                    key,
+                    result,
+                    page_id=page_id,
+                    related_ids=related_ids(result) if related_ids else (),
+                )
+            return result
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = tuple(item for item in bound.arguments.items() if item[0] != "ctx")
+
+            cached = cache.get(key)
+            if isinstance(cached, Exception):
+                # Drop the traceback left by the previous raise of this instance
+                raise cached.with_traceback(None)
+            if cached is not _MISSING:
+                return cast(Dict[str, Any], cached)
+
+            inflight = cache.inflight.get(key)
+            if inflight is None:
+                page_id = bound.arguments.get("page_id")
+                task: "asyncio.Future[Any]" = asyncio.ensure_future(
+                    fill(key, page_id, args, kwargs)
+                )
+                cache.inflight[key] = (page_id, task)
+
+                def done(_: Any) -> None:
+                    # An invalidation may have replaced it with a newer fetch
+                    if cache.inflight.get(key, (None, None))[1] is task:
+                        del cache.inflight[key]
+
+                task.add_done_callback(done)
+            else:
+                task = inflight[1]
+            # Shielded so one caller giving up does not cancel the others' fetch
+            return cast(Dict[str, Any], await asyncio.shield(task))
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def invalidate(page_id: Optional[Any]) -> None:
+    """Purge cached reads of a page after it or its comments/labels change."""
+    if page_id is None:
+        return
+    for cache in _CACHES:
+        cache.invalidate(str(page_id))
+
+
+def clear() -> None:
+    """Empty every tool cache."""
+    for cache in _CACHES:
+        cache.clear()
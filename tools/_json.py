@@ -0,0 +1,10 @@
+"""JSON serialization of tool results."""
+
+from typing import Any
+
+import pydantic_core
+
+
+def dumps(data: Any) -> str:
+    """Serialize a tool result to compact JSON."""
+    return pydantic_core.to_json(data, fallback=str).decode()
@@ -0,0 +1,64 @@
+"""Helpers shared by the Confluence tools."""
+
+import functools
+from dataclasses import fields
+from operator import attrgetter
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Dict[str, Any]]])
+
+# Confluence client from the server lifespan context (server.py AppContext)
+get_client = attrgetter("request_context.lifespan_context.confluence")
+
+
+def dataclass_formatter(model: type) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Build a function that turns a model instance into a response dict.
+
+    Only the model's declared fields are included, read with a single
+    precompiled attrgetter.
+
+    Args:
+        model: Dataclass model type with at least two fields
+
+    Returns:
+        Function mapping an instance to a dict of its field values
+    """
+    names = tuple(field.name for field in fields(model))
+    values = attrgetter(*names)
+
+    def format_record(record: Any) -> Dict[str, Any]:
+        return dict(zip(names, values(record), strict=False))
+
+    return format_record
+
+
+def ok(**payload: Any) -> Dict[str, Any]:
+    """Return a successful tool result carrying payload."""
+    return {"status": "success", **payload}
+
+
+def err(exc: Exception) -> Dict[str, Any]:
+    """Return a failed tool result describing exc."""
+    return {"status": "error", "message": str(exc)}
+
+
+def tool_endpoint(func: F) -> F:
+    """
+    Turn any exception raised by a tool into an error result.
+
+    Args:
+        func: Async tool function returning a result dict
+
+    Returns:
+        Tool function that returns err(exc) instead of raising
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+        try:
+            return await func(*args, **kwargs)
+        except Exception as e:
+            return err(e)
+
+    return wrapper  # type: ignore[return-value]
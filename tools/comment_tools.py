@@ -4,11 +4,20 @@ from typing import Any, Dict
 
 from fastmcp import Context
 
+from confluence.models import Comment, Label
+from tools._cache import invalidate, ttl_cache
+from tools._util import dataclass_formatter, get_client, ok, tool_endpoint
+
+_format_comment = dataclass_formatter(Comment)
+_format_label = dataclass_formatter(Label)
+
 
 class CommentTools:
     """Tools for managing comments on Confluence pages."""
 
     @staticmethod
+    @tool_endpoint
+    @ttl_cache(negative_ttl=5)
     async def get_comments(
         ctx: Context,
         page_id: str,
@@ -24,22 +33,16 @@ class CommentTools:
         Returns:
             Dictionary with comments information
         """
-        client = ctx.request_context.lifespan_context.confluence
-
-        try:
-            comments = await client.get_comments(page_id=page_id, depth=depth)
-            return {
-                "status": "success",
-                "comments": [comment.__dict__ for comment in comments],
-                "count": len(comments),
-            }
-        except Exception as e:
-            return {
-                "status": "error",
-                "message": str(e),
-            }
+        client = get_client(ctx)
+
+        comments = await client.get_comments(page_id=page_id, depth=depth)
+        return ok(
+            comments=[_format_comment(comment) for comment in comments],
+            count=len(comments),
+        )
 
     @staticmethod
+    @tool_endpoint
     async def add_comment(
         ctx: Context,
         page_id: str,
@@ -55,21 +58,15 @@ class CommentTools:
         Returns:
             Dictionary with created comment information
         """
-        client = ctx.request_context.lifespan_context.confluence
-
-        try:
-            comment = await client.add_comment(page_id=page_id, content=content)
-            return {
-                "status": "success",
-                "comment": comment.__dict__,
-            }
-        except Exception as e:
-            return {
-                "status": "error",
-                "message": str(e),
-            }
+        client = get_client(ctx)
+
+        comment = await client.add_comment(page_id=page_id, content=content)
+        invalidate(page_id)
+        return ok(comment=_format_comment(comment))
 
     @staticmethod
+    @tool_endpoint
+    @ttl_cache()
     async def get_labels(
         ctx: Context,
         page_id: str,
@@ -83,22 +80,13 @@ class CommentTools:
         Returns:
             Dictionary with labels information
         """
-        client = ctx.request_context.lifespan_context.confluence
-
-        try:
-            labels = await client.get_labels(page_id=page_id)
-            return {
-                "status": "success",
-                "labels": [label.__dict__ for label in labels],
-                "count": len(labels),
-            }
-        except Exception as e:
-            return {
-                "status": "error",
-                "message": str(e),
-            }
+        client = get_client(ctx)
+
+        labels = await client.get_labels(page_id=page_id)
+        return ok(labels=[_format_label(label) for label in labels], count=len(labels))
 
     @staticmethod
+    @tool_endpoint
     async def add_label(
         ctx: Context,
         page_id: str,
@@ -114,17 +102,9 @@ class CommentTools:
         Returns:
             Dictionary with operation result
         """
-        client = ctx.request_context.lifespan_context.confluence
-
-        try:
-            result = await client.add_label(page_id=page_id, label=label)
-            # Ensure we return a Dict[str, Any]
-            if isinstance(result, dict):
-                return result
-            else:
-                return {"status": "success", "result": result}
-        except Exception as e:
-            return {
-                "status": "error",
-                "message": str(e),
-            }
+        client = get_client(ctx)
+
+        result = await client.add_label(page_id=page_id, label=label)
+        invalidate(page_id)
+        # The client reports its own status, which takes precedence
+        return ok(**result)
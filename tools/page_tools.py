@@ -1,15 +1,49 @@
 """Tools for page operations in Confluence."""
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, TypeVar
 
 from fastmcp import Context
 
+from confluence.models import Comment, Label, Page
+from tools._cache import invalidate, ttl_cache
+from tools._util import dataclass_formatter, get_client, ok, tool_endpoint
+
+logger = logging.getLogger(__name__)
+
+_format_page = dataclass_formatter(Page)
+_format_comment = dataclass_formatter(Comment)
+_format_label = dataclass_formatter(Label)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def _expand(
+    items: Iterable[T], fn: Callable[[T], Awaitable[R]], concurrency: int = 5
+) -> List[R]:
+    """
+    Await fn for every item concurrently, in order.
+
+    At most concurrency calls are in flight at once, which keeps the latency
+    of a large fan-out down without flooding the Confluence API.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def guarded(item: T) -> R:
+        async with semaphore:
+            return await fn(item)
+
+    return await asyncio.gather(*(guarded(item) for item in items))
+
 
 class PageTools:
     """Tools for interacting with Confluence pages."""
 
     @staticmethod
+    @tool_endpoint
+    @ttl_cache(negative_ttl=5)
     async def get_page(
         ctx: Context,
         page_id: str,
@@ -25,24 +59,14 @@ class PageTools:
         Returns:
             Dictionary with page information
         """
-        client = ctx.request_context.lifespan_context.confluence
-
-        try:
-            page = await client.get_page(page_id=page_id, include_body=include_body)
-            # Log the payload to a local log file
-            logging.basicConfig(filename="confluence_client.log", level=logging.INFO)
-            logging.info("Payload for page_id %s: %s", page_id, page.__dict__)
-            return {
-                "status": "success",
-                "page": page.__dict__,
-            }
-        except Exception as e:
-            return {
-                "status": "error",
-                "message": str(e),
-            }
+        client = get_client(ctx)
+
+        page = await client.get_page(page_id=page_id, include_body=include_body)
+        logger.debug("page %s fetched", page_id)
+        return ok(page=_format_page(page))
 
     @staticmethod
+    @tool_endpoint
     async def create_page(
         ctx: Context,
         title: str,
@@ -64,27 +88,20 @@ class PageTools:
         Returns:
             Dictionary with created page information
         """
-        client = ctx.request_context.lifespan_context.confluence
-
-        try:
-            page = await client.create_page(
-                space_key=space_key,
-                title=title,
-                content=content,
-                parent_id=parent_id,
-                content_format=content_format,
-            )
-            return {
-                "status": "success",
-                "page": page.__dict__,
-            }
-        except Exception as e:
-            return {
-                "status": "error",
-                "message": str(e),
-            }
+        client = get_client(ctx)
+
+        page = await client.create_page(
+            space_key=space_key,
+            title=title,
+            content=content,
+            parent_id=parent_id,
+            content_format=content_format,
+        )
+        invalidate(parent_id)
+        return ok(page=_format_page(page))
 
     @staticmethod
+    @tool_endpoint
     async def update_page(
         ctx: Context,
         page_id: str,
@@ -108,28 +125,21 @@ class PageTools:
         Returns:
             Dictionary with updated page information
         """
-        client = ctx.request_context.lifespan_context.confluence
-
-        try:
-            page = await client.update_page(
-                page_id=page_id,
-                title=title,
-                content=content,
-                minor_edit=minor_edit,
-                content_format=content_format,
-                version_comment=version_comment,
-            )
-            return {
-                "status": "success",
-                "page": page.__dict__,
-            }
-        except Exception as e:
-            return {
-                "status": "error",
-                "message": str(e),
-            }
+        client = get_client(ctx)
+
+        page = await client.update_page(
+            page_id=page_id,
+            title=title,
+            content=content,
+            minor_edit=minor_edit,
+            content_format=content_format,
+            version_comment=version_comment,
+        )
+        invalidate(page_id)
+        return ok(page=_format_page(page))
 
     @staticmethod
+    @tool_endpoint
     async def delete_page(
         ctx: Context,
         page_id: str,
@@ -143,22 +153,20 @@ class PageTools:
         Returns:
             Dictionary with operation result
         """
-        client = ctx.request_context.lifespan_context.confluence
+        client = get_client(ctx)
 
-        try:
-            result = await client.delete_page(page_id=page_id)
-            return {"status": "success", "page_id": result["page_id"]}
-        except Exception as e:
-            return {
-                "status": "error",
-                "message": str(e),
-            }
+        result = await client.delete_page(page_id=page_id)
+        invalidate(page_id)
+        return ok(page_id=result["page_id"])
 
     @staticmethod
+    @tool_endpoint
+    @ttl_cache(related_ids=lambda result: [page["id"] for page in result["children"]])
     async def get_page_children(
         ctx: Context,
         page_id: str,
         limit: int = 25,
+        include_body: bool = False,
     ) -> Dict[str, Any]:
         """
         Get child pages of a Confluence page.
@@ -166,50 +174,86 @@ class PageTools:
         Args:
             page_id: ID of the parent page
             limit: Maximum number of children to return
+            include_body: Whether to fetch the full content of each child page
 
         Returns:
             Dictionary with child pages information
         """
-        client = ctx.request_context.lifespan_context.confluence
-
-        try:
-            pages = await client.get_page_children(page_id=page_id, limit=limit)
-            return {
-                "status": "success",
-                "children": [page.__dict__ for page in pages],
-                "count": len(pages),
-            }
-        except Exception as e:
-            return {
-                "status": "error",
-                "message": str(e),
-            }
+        client = get_client(ctx)
+
+        pages = await client.get_page_children(page_id=page_id, limit=limit)
+        if include_body:
+            pages = await _expand(
+                pages,
+                lambda page: client.get_page(page_id=page.id, include_body=True),
+            )
+        return ok(children=[_format_page(page) for page in pages], count=len(pages))
 
     @staticmethod
+    @tool_endpoint
+    @ttl_cache(related_ids=lambda result: [page["id"] for page in result["ancestors"]])
     async def get_page_ancestors(
         ctx: Context,
         page_id: str,
+        include_body: bool = False,
     ) -> Dict[str, Any]:
         """
         Get ancestor (parent) pages of a Confluence page.
 
         Args:
             page_id: ID of the page
+            include_body: Whether to fetch the full content of each ancestor page
 
         Returns:
             Dictionary with ancestor pages information
         """
-        client = ctx.request_context.lifespan_context.confluence
-
-        try:
-            pages = await client.get_page_ancestors(page_id=page_id)
-            return {
-                "status": "success",
-                "ancestors": [page.__dict__ for page in pages],
-                "count": len(pages),
-            }
-        except Exception as e:
-            return {
-                "status": "error",
-                "message": str(e),
-            }
+        client = get_client(ctx)
+
+        pages = await client.get_page_ancestors(page_id=page_id)
+        if include_body:
+            pages = await _expand(
+                pages,
+                lambda page: client.get_page(page_id=page.id, include_body=True),
+            )
+        return ok(ancestors=[_format_page(page) for page in pages], count=len(pages))
+
+    @staticmethod
+    @tool_endpoint
+    @ttl_cache()
+    async def get_page_full(
+        ctx: Context,
+        page_id: str,
+        include_comments: bool = True,
+        include_labels: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Get a Confluence page together with its comments and labels.
+
+        The page, comments and labels are requested concurrently, so this takes
+        one round trip instead of one per tool.
+
+        Args:
+            page_id: The ID of the Confluence page
+            include_comments: Whether to include the page's comments
+            include_labels: Whether to include the page's labels
+
+        Returns:
+            Dictionary with page, comments and labels information
+        """
+        client = get_client(ctx)
+
+        requests = [client.get_page(page_id=page_id, include_body=True)]
+        if include_comments:
+            requests.append(client.get_comments(page_id=page_id))
+        if include_labels:
+            requests.append(client.get_labels(page_id=page_id))
+
+        page, *related = await asyncio.gather(*requests)
+        response = ok(page=_format_page(page))
+        if include_comments:
+            comments = related.pop(0)
+            response["comments"] = [_format_comment(comment) for comment in comments]
+        if include_labels:
+            labels = related.pop(0)
+            response["labels"] = [_format_label(label) for label in labels]
+        return response
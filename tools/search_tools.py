@@ -4,11 +4,19 @@ from typing import Any, Dict, List, Optional
 
 from fastmcp import Context
 
+from confluence.models import SearchResult, Space
+from tools._cache import ttl_cache
+from tools._util import dataclass_formatter, get_client, ok, tool_endpoint
+
+_format_result = dataclass_formatter(SearchResult)
+_format_space = dataclass_formatter(Space)
+
 
 class SearchTools:
     """Tools for searching content in Confluence."""
 
     @staticmethod
+    @tool_endpoint
     async def search_confluence(
         ctx: Context,
         query: str,
@@ -28,25 +36,19 @@ class SearchTools:
         Returns:
             Dictionary with search results
         """
-        client = ctx.request_context.lifespan_context.confluence
+        client = get_client(ctx)
 
-        try:
-            results = await client.search(
-                query=query, spaces=spaces, content_type=content_type, limit=limit
-            )
+        results = await client.search(
+            query=query, spaces=spaces, content_type=content_type, limit=limit
+        )
 
-            return {
-                "status": "success",
-                "results": [result.__dict__ for result in results],
-                "count": len(results),
-            }
-        except Exception as e:
-            return {
-                "status": "error",
-                "message": str(e),
-            }
+        return ok(
+            results=[_format_result(result) for result in results], count=len(results)
+        )
 
     @staticmethod
+    @tool_endpoint
+    @ttl_cache()
     async def get_spaces(
         ctx: Context,
         limit: int = 25,
@@ -60,17 +62,7 @@ class SearchTools:
         Returns:
             Dictionary with spaces information
         """
-        client = ctx.request_context.lifespan_context.confluence
+        client = get_client(ctx)
 
-        try:
-            spaces = await client.get_spaces(limit=limit)
-            return {
-                "status": "success",
-                "spaces": [space.__dict__ for space in spaces],
-                "count": len(spaces),
-            }
-        except Exception as e:
-            return {
-                "status": "error",
-                "message": str(e),
-            }
+        spaces = await client.get_spaces(limit=limit)
+        return ok(spaces=[_format_space(space) for space in spaces], count=len(spaces))
@@ -0,0 +1,34 @@
+#!/bin/bash
+
+# Run the test suite
+# Usage: ./unittest.sh [fast|report] [pytest args...]
+#   (no option)  full suite with coverage
+#   fast         skip error-path tests and coverage for a quick edit/test loop
+#   report       fail if any tool test phase takes longer than
+#                REPORT_THRESHOLD seconds (default: 0.1)
+
+set -euo pipefail
+
+case "${1:-}" in
+    fast)
+        shift
+        uv run pytest -m "not error_path" --no-cov "$@"
+        ;;
+    report)
+        shift
+        threshold="${REPORT_THRESHOLD:-0.1}"
+        status=0
+        output=$(uv run pytest tests/test_tools.py --no-cov --durations=0 --durations-min="$threshold" "$@") || status=$?
+        echo "$output"
+        if [ "$status" -ne 0 ]; then
+            exit "$status"
+        fi
+        if grep -Eq '^[0-9.]+s +(setup|call|teardown) ' <<< "$output"; then
+            echo "Error: the tests listed above took longer than ${threshold}s"
+            exit 1
+        fi
+        ;;
+    *)
+        uv run pytest "$@"
+        ;;
+esac
@@ -1,82 +1,109 @@
 #!/usr/bin/env python3
 """Script to update coverage badge in README.md"""
 
+import bisect
+import functools
 import json
 import re
 import sys
 from pathlib import Path
+from typing import Any, Callable, Dict, Optional
 
+try:
+    import orjson
 
-def get_coverage_percentage() -> int:
-    """Get coverage percentage from coverage.json file."""
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _json_loads = json.loads
+
+# Pattern to match existing coverage badge
+_BADGE_RE = re.compile(
+    rb"!\[Coverage\]\(https://img\.shields\.io/badge/coverage-\d+%25-\w+\)"
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_coverage(path: Path, mtime_ns: int) -> Dict[str, Any]:
+    """Load a coverage report, cached until the file's mtime changes."""
+    coverage_data: Dict[str, Any] = _json_loads(path.read_bytes())
+    return coverage_data
+
+
+def get_coverage_percentage() -> Optional[int]:
+    """Get coverage percentage from coverage.json file, or None if it is missing."""
     coverage_file = Path("coverage.json")
 
     if not coverage_file.exists():
         print("coverage.json not found. Run 'uv run pytest' first.")
-        sys.exit(1)
+        return None
 
-    with open(coverage_file) as f:
-        coverage_data = json.load(f)
+    coverage_data = _load_coverage(coverage_file, coverage_file.stat().st_mtime_ns)
 
     total_coverage = coverage_data["totals"]["percent_covered"]
     return int(round(total_coverage))
 
 
+# Lowest percentage for each badge color after red, ascending
+_THRESHOLDS = (50, 60, 70, 80, 90)
+_COLORS = ("red", "orange", "yellow", "yellowgreen", "green", "brightgreen")
+
+
 def get_badge_color(percentage: int) -> str:
     """Get badge color based on coverage percentage."""
-    if percentage >= 90:
-        return "brightgreen"
-    elif percentage >= 80:
-        return "green"
-    elif percentage >= 70:
-        return "yellowgreen"
-    elif percentage >= 60:
-        return "yellow"
-    elif percentage >= 50:
-        return "orange"
-    else:
-        return "red"
-
-
-def update_readme_badge(percentage: int) -> None:
-    """Update coverage badge in README.md."""
+    return _COLORS[bisect.bisect_right(_THRESHOLDS, percentage)]
+
+
+def update_readme_badge(percentage: int) -> bool:
+    """Update coverage badge in README.md, returning False if it is missing."""
     readme_file = Path("README.md")
 
     if not readme_file.exists():
         print("README.md not found.")
-        sys.exit(1)
-
-    content = readme_file.read_text()
+        return False
 
     color = get_badge_color(percentage)
     new_badge = (
         f"![Coverage](https://img.shields.io/badge/coverage-{percentage}%25-{color})"
     )
 
-    # Pattern to match existing coverage badge
-    pattern = r"!\[Coverage\]\(https://img\.shields\.io/badge/coverage-\d+%25-\w+\)"
-
-    if re.search(pattern, content):
-        # Replace existing badge
-        new_content = re.sub(pattern, new_badge, content)
-    else:
-        # Add badge after the main title
-        lines = content.split("\n")
-        for i, line in enumerate(lines):
-            if line.startswith("# ") and not line.startswith("## "):
-                lines.insert(i + 2, new_badge)
-                lines.insert(i + 3, "")
-                break
-        new_content = "\n".join(lines)
-
-    readme_file.write_text(new_content)
+    # Read and rewrite the README through a single file handle
+    with readme_file.open("r+b") as f:
+        content = f.read()
+
+        # The badge is ASCII, so it is found and replaced without decoding
+        new_content, replaced = _BADGE_RE.subn(new_badge.encode(), content)
+        if not replaced:
+            # Add badge after the main title, keeping the README's line endings
+            newline = "\r\n" if b"\r\n" in content else "\n"
+            lines = content.decode("utf-8").split(newline)
+            for i, line in enumerate(lines):
+                if line.startswith("# ") and not line.startswith("## "):
+                    lines.insert(i + 2, new_badge)
+                    lines.insert(i + 3, "")
+                    break
+            else:
+                print("README.md has no main title to add the coverage badge after.")
+                return True
+            new_content = newline.join(lines).encode("utf-8")
+
+        if new_content == content:
+            # Leave the file untouched so its mtime and watchers are unaffected
+            print(f"README.md coverage badge unchanged: {percentage}% ({color})")
+            return True
+
+        f.seek(0)
+        f.write(new_content)
+        f.truncate()
+
     print(f"Updated README.md with coverage badge: {percentage}% ({color})")
+    return True
 
 
 def main() -> None:
     """Main function."""
     percentage = get_coverage_percentage()
-    update_readme_badge(percentage)
+    if percentage is None or not update_readme_badge(percentage):
+        sys.exit(1)
 
 
 if __name__ == "__main__":